@@ -6,9 +6,12 @@ It coordinates the clicking behavior by running a background thread that
 executes clicks at randomized intervals for natural behavior simulation.
 """
 
+import concurrent.futures
 import threading
+import time
 import random
-from typing import Callable, Optional
+import weakref
+from typing import Callable, Final, NamedTuple, Optional
 
 # Import configuration constants
 from .config import MIN_CLICK_DELAY, MAX_CLICK_DELAY, CONSOLE_OUTPUT_ENABLED
@@ -16,6 +19,68 @@ from .config import MIN_CLICK_DELAY, MAX_CLICK_DELAY, CONSOLE_OUTPUT_ENABLED
 # Import required modules for Phase 5 implementation
 from .mouse_controller import MouseController
 
+# Shared worker pool for all scheduler instances. Thread creation is paid
+# once per worker and reused across start/stop cycles (and across the
+# multiple-scheduler support noted in the TODOs). The workers are NOT
+# daemons: the executor joins them at interpreter shutdown, so any loop
+# still running at exit would hang the process — the atexit hook below
+# flags every live scheduler to stop before that join runs.
+_EXECUTOR: Final = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="ClickScheduler"
+)
+
+# Live schedulers, tracked weakly so the shutdown hook can reach their
+# stop flags without keeping abandoned instances alive.
+_LIVE_SCHEDULERS: Final["weakref.WeakSet"] = weakref.WeakSet()
+
+
+def _stop_all_schedulers() -> None:
+    """Interpreter-shutdown hook: stop every live clicking loop.
+
+    Registered after concurrent.futures installed its own hook (at the
+    import above); threading runs these callbacks in reverse registration
+    order, so the stop flags are set before the executor joins its
+    workers and the joins complete instead of hanging forever.
+    """
+    for scheduler in list(_LIVE_SCHEDULERS):
+        scheduler._stop = True
+
+
+try:
+    threading._register_atexit(_stop_all_schedulers)
+except Exception:  # pragma: no cover - interpreter already shutting down
+    pass
+
+# Debug logging bound once at import: a real printer when console output is
+# enabled, a no-op otherwise. Callers pass printf-style args so no message
+# string is built when logging is disabled.
+if CONSOLE_OUTPUT_ENABLED:
+    def _log(message: str, *args: object) -> None:
+        print(message % args if args else message)
+else:
+    def _log(message: str, *args: object) -> None:
+        pass
+
+# Number of delays generated per batch; amortizes RNG call overhead across
+# many clicks while keeping the buffer small enough to discard cheaply when
+# the delay bounds change.
+DELAY_BATCH_SIZE: Final[int] = 256
+
+# Module-level aliases of the config bounds, pre-coerced to float once at
+# import time instead of per-scheduler construction.
+_MIN_DELAY: Final[float] = float(MIN_CLICK_DELAY)
+_MAX_DELAY: Final[float] = float(MAX_CLICK_DELAY)
+
+
+class SchedulerStatus(NamedTuple):
+    """Point-in-time snapshot of scheduler state for monitoring/debugging."""
+
+    is_active: bool
+    thread_alive: bool
+    thread_name: Optional[str]
+    min_delay: float
+    max_delay: float
+
 
 class ClickScheduler:
     """
@@ -29,10 +94,12 @@ class ClickScheduler:
     
     The scheduler implements a producer-consumer pattern where it produces
     click commands that are consumed by the mouse controller.
-    
-    TODO: In Phase 5, implement threading with threading.Thread
-    TODO: Use random.uniform() for generating delays between clicks
-    TODO: Ensure thread-safe access to is_active flag
+
+    Concurrency model: rare-writer, frequent-reader. Mutable configuration
+    (the delay bounds) is published as an immutable tuple snapshot that
+    writers replace wholesale and the clicking thread reads with a single
+    atomic attribute load; the stop flag lives separately as a plain bool.
+    No locks are involved anywhere.
     """
 
     def __init__(
@@ -49,137 +116,206 @@ class ClickScheduler:
         if mouse_controller is None:
             raise ValueError("mouse_controller must not be None")
         self.mouse_controller: MouseController = mouse_controller
-        self.is_active: bool = False
-        self.thread: Optional[threading.Thread] = None
-        # Lock to ensure thread-safe access to is_active and state changes
-        self._state_lock = threading.Lock()
-        self._stop_event = threading.Event()
-        # Runtime-adjustable delay bounds
-        self._min_delay: float = float(MIN_CLICK_DELAY)
-        self._max_delay: float = float(MAX_CLICK_DELAY)
+        # Pre-bound click method: one attribute hop instead of the
+        # self.mouse_controller.click_at_locked_position chain. Swapping the
+        # controller mid-run is not supported (and never was).
+        self._click: Callable[[], None] = mouse_controller.click_at_locked_position
+        # The future doubles as the "running" sentinel: the scheduler is
+        # active iff an unfinished future is attached. Assignment is
+        # GIL-atomic, so no lock object is needed for steady-state checks.
+        self._future: Optional[concurrent.futures.Future] = None
+        # Plain bool stop flag; attribute stores/loads are atomic under the
+        # GIL, so no Event/Condition machinery is needed for a rare wakeup.
+        self._stop: bool = False
+        # Runtime-adjustable delay bounds, published as a single tuple so
+        # readers get both values with one GIL-atomic attribute load.
+        self._delay_bounds: tuple = (_MIN_DELAY, _MAX_DELAY)
         self._next_delay_callback: Optional[Callable[[Optional[float]], None]] = next_delay_callback
-        
-        if CONSOLE_OUTPUT_ENABLED:
-            print("ClickScheduler initialized")
+        # Visible to the interpreter-shutdown hook; see _stop_all_schedulers.
+        _LIVE_SCHEDULERS.add(self)
+
+        _log("ClickScheduler initialized")
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the scheduler currently has a running clicking loop."""
+        future = self._future
+        return future is not None and not future.done()
 
     def start(self) -> None:
         """
-        Start the click scheduler in a background thread.
-        
+        Start the click scheduler on the shared worker pool.
+
         This method should:
-        1. Set is_active to True
-        2. Create a new thread running _clicking_loop()
-        3. Start the thread with daemon=True for clean exit
-        4. Return immediately to avoid blocking
-        
+        1. Submit the loop closure from _build_loop() to the shared executor
+        2. Return immediately to avoid blocking
+
         Raises:
             RuntimeError: If scheduler is already running
         """
-        # Thread-safe activation
-        with self._state_lock:
-            if self.is_active:
-                raise RuntimeError("Click scheduler is already running")
-            self.is_active = True
-            self._stop_event.clear()
-
-        # Create and start the background thread
-        self.thread = threading.Thread(
-            target=self._clicking_loop,
-            name="ClickSchedulerThread",
-            daemon=True,
-        )
+        if self.is_active:
+            raise RuntimeError("Click scheduler is already running")
+        self._stop = False
+
+        # Submit the loop to the shared pool; worker threads are created on
+        # first use and reused across start/stop cycles instead of paying
+        # OS-thread creation per start(). The loop closure is specialized
+        # for the current CONSOLE_OUTPUT_ENABLED setting.
         try:
-            self.thread.start()
-            if CONSOLE_OUTPUT_ENABLED:
-                print("Click scheduler started")
+            self._future = _EXECUTOR.submit(self._build_loop())
+            _log("Click scheduler started")
         except Exception as e:
-            # Roll back active state on failure
-            with self._state_lock:
-                self.is_active = False
-            self.thread = None
-            if CONSOLE_OUTPUT_ENABLED:
-                print(f"Failed to start click scheduler thread: {e}")
+            # Roll back the running sentinel on failure
+            self._future = None
+            _log("Failed to start click scheduler loop: %s", e)
             raise
 
     def stop(self) -> None:
         """
-        Stop the click scheduler and wait for thread completion.
-        
+        Stop the click scheduler and wait for loop completion.
+
         This method:
-        1. Sets is_active to False to signal thread to stop
-        2. Waits for the thread to complete (join) with timeout
-        3. Cleans up the thread reference
+        1. Sets the stop flag to signal the loop to exit
+        2. Detaches the future (clearing the running sentinel)
+        3. Waits for the loop to complete with timeout
         4. Logs state transitions if enabled
         """
-        # Thread-safe deactivation
-        with self._state_lock:
-            if not self.is_active:
-                return
-            self.is_active = False
-            self._stop_event.set()
-
-        # Join the thread to wait for completion
-        if self.thread is not None:
+        if not self.is_active:
+            return
+        self._stop = True
+        future = self._future
+        self._future = None
+
+        # Wait for the loop to finish; it only observes the stop flag at
+        # sleep boundaries, so allow up to a full delay cycle.
+        if future is not None:
             try:
-                # Timeout slightly above max delay to avoid hanging
-                timeout = float(self._max_delay) + 1.0
-                self.thread.join(timeout=timeout)
+                future.result(timeout=float(self._delay_bounds[1]) + 0.5)
+            except concurrent.futures.TimeoutError:
+                _log("Click scheduler loop did not exit within timeout")
             except Exception as e:
-                if CONSOLE_OUTPUT_ENABLED:
-                    print(f"Error while joining click scheduler thread: {e}")
-            finally:
-                if self.thread.is_alive() and CONSOLE_OUTPUT_ENABLED:
-                    print("Click scheduler thread did not exit within timeout")
-                self.thread = None
+                _log("Error while waiting for click scheduler loop: %s", e)
 
-        if CONSOLE_OUTPUT_ENABLED:
-            print("Click scheduler stopped")
+        _log("Click scheduler stopped")
         self._notify_next_delay(None)
 
-    def _clicking_loop(self) -> None:
+    def _build_loop(self) -> Callable[[], None]:
         """
-        Main clicking loop that runs in a background thread.
-        
-        This method:
-        1. Loops while is_active is True
-        2. Generates random delay using random.uniform()
-        3. Sleeps for the delay duration
+        Build the clicking-loop closure that runs in a background thread.
+
+        The returned closure:
+        1. Loops until the stop flag is set
+        2. Generates a random delay and derives an absolute deadline from it
+        3. Sleeps until the deadline on the monotonic clock
         4. Executes click via mouse_controller.click_at_locked_position()
         5. Handles any exceptions gracefully
+
+        Scheduling is deadline-based: each click's target timestamp is
+        computed from the previous deadline rather than from "now", so click
+        execution time and loop overhead do not accumulate as drift.
+
+        The loop is lock-free: the stop flag is a plain bool whose stores
+        and loads are atomic under the GIL, so no synchronization primitives
+        are needed. stop() may not prevent the currently-scheduled click from
+        executing; the loop is interruptible only at sleep boundaries, and one
+        straggling click after a user-initiated stop is harmless.
+
+        The error handler is chosen once at build time (partial evaluation):
+        in production, CONSOLE_OUTPUT_ENABLED is False and the exception path
+        carries no debug-formatting branch at all.
         """
-        while True:
-            # Check active state under lock for thread safety
-            with self._state_lock:
-                active = self.is_active
-            if not active:
-                break
+        # Hoist globals and attribute chains into closure locals so the loop
+        # body uses LOAD_FAST/LOAD_DEREF instead of repeated dict/MRO lookups.
+        rnd = random.random
+        sleep = time.sleep
+        monotonic = time.monotonic
+        click = self._click
+        notify = self._notify_next_delay
 
-            try:
-                # Generate random delay between configured bounds
-                # Re-read under lock to avoid stale values during updates
-                with self._state_lock:
-                    mn = float(self._min_delay)
-                    mx = float(self._max_delay)
-                delay = random.uniform(mn, mx)
-                self._notify_next_delay(delay)
-                interrupted = self._stop_event.wait(delay)
-                if interrupted:
-                    continue
-
-                # Double-check active state before clicking
-                with self._state_lock:
-                    if not self.is_active:
-                        continue
-
-                # Execute the click
-                self.mouse_controller.click_at_locked_position()
-            except Exception as e:
-                # Handle errors silently per requirements, with optional logging
-                if CONSOLE_OUTPUT_ENABLED:
-                    print(f"Click execution error: {e}")
-                continue
+        # Specialize the exception handler for the debug setting at build
+        # time instead of branching on it inside the (rare) except path.
+        if CONSOLE_OUTPUT_ENABLED:
+            def handle_error(e: Exception) -> None:
+                print(f"Click execution error: {e}")
+        else:
+            def handle_error(e: Exception) -> None:
+                pass
 
-        self._notify_next_delay(None)
+        def loop() -> None:
+            # Specialize uniform(a, b) to low + random() * width for the
+            # current bounds; random.random() is a bare C call with no
+            # argument handling. set_delay_range publishes a fresh tuple, so
+            # an identity check is enough to know when to recompute.
+            bounds = self._delay_bounds
+            low, high = bounds
+            width = high - low
+
+            # Pre-generate delays in batches so the per-click RNG cost is a
+            # list pop instead of a function call; the batch is discarded
+            # when the bounds change.
+            buf = [low + rnd() * width for _ in range(DELAY_BATCH_SIZE)]
+
+            # Absolute deadline for the next click; advancing it by each
+            # sampled delay (instead of sleeping relative durations) keeps
+            # the long-run click rate at 100% of nominal.
+            next_t = monotonic() + buf.pop()
+
+            while not self._stop:
+                try:
+                    # Refresh the (low, width) cache when set_delay_range ran.
+                    current = self._delay_bounds
+                    if current is not bounds:
+                        bounds = current
+                        low, high = bounds
+                        width = high - low
+                        buf.clear()
+
+                    now = monotonic()
+                    notify(max(0.0, next_t - now))
+                    while now < next_t and not self._stop:
+                        gap = next_t - now
+                        if gap < 0.005:
+                            # For sub-5 ms gaps a kernel sleep costs more
+                            # than the wait itself (timer-resolution jitter
+                            # plus the syscall round-trip), so spin on the
+                            # monotonic clock instead.
+                            pass
+                        else:
+                            # Sleep in bounded slices so the stop flag —
+                            # set by stop() or the shutdown hook — is
+                            # observed within ~0.5 s instead of only after
+                            # a full 8-10 s delay.
+                            sleep(gap if gap < 0.5 else 0.5)
+                        now = monotonic()
+                    if self._stop:
+                        break
+
+                    # Execute the click; no re-check of the stop flag here —
+                    # the loop exits on the next iteration instead. The
+                    # inner try keeps a click failure from skipping the
+                    # rescheduling below: with a stale deadline the next
+                    # iteration would skip the sleep and retry immediately,
+                    # so a persistently failing click (e.g. the FAILSAFE
+                    # corner-abort gesture) would busy-spin the loop.
+                    try:
+                        click()
+                    except Exception as e:
+                        handle_error(e)
+                except Exception as e:
+                    # Handle errors silently per requirements; the handler is
+                    # a no-op unless debug output was enabled at build time.
+                    handle_error(e)
+
+                # Schedule the following click; clamp to "now" if the click
+                # (or an oversleep) overran the sampled delay. Runs on
+                # success and failure alike so the deadline always advances.
+                if not buf:
+                    buf = [low + rnd() * width for _ in range(DELAY_BATCH_SIZE)]
+                next_t = max(next_t + buf.pop(), monotonic())
+
+            self._notify_next_delay(None)
+
+        return loop
 
     def set_next_delay_callback(self, callback: Optional[Callable[[Optional[float]], None]]) -> None:
         self._next_delay_callback = callback
@@ -193,22 +329,23 @@ class ClickScheduler:
         except Exception:
             pass
 
-    def get_status(self) -> dict:
+    def get_status(self) -> SchedulerStatus:
         """
         Get current scheduler status information.
-        
+
         Returns:
-            dict: Status information including active state and thread info
-            
-        TODO: Implement status reporting for monitoring/debugging
+            SchedulerStatus: Active state, thread info, and delay bounds.
+            NamedTuple construction avoids the per-call dict allocation with
+            string keys, which matters when status is polled by a UI loop.
         """
-        return {
-            'is_active': self.is_active,
-            'thread_alive': self.thread.is_alive() if self.thread else False,
-            'thread_name': self.thread.name if self.thread else None,
-            'min_delay': self._min_delay,
-            'max_delay': self._max_delay,
-        }
+        active = self.is_active
+        return SchedulerStatus(
+            active,
+            active,
+            "ClickScheduler" if active else None,
+            self._delay_bounds[0],
+            self._delay_bounds[1],
+        )
         
     # TODO: Add additional methods for future features:
     # - Dynamic delay adjustment
@@ -230,8 +367,7 @@ class ClickScheduler:
             return
         if mn > mx:
             mn, mx = mx, mn
-        with self._state_lock:
-            self._min_delay = mn
-            self._max_delay = mx
-        if CONSOLE_OUTPUT_ENABLED:
-            print(f"[DEBUG] ClickScheduler delay range set to {self._min_delay:.2f}s - {self._max_delay:.2f}s")
+        # Single pointer store — GIL-atomic, so no lock is needed between
+        # this writer and the clicking loop's reads.
+        self._delay_bounds = (mn, mx)
+        _log("[DEBUG] ClickScheduler delay range set to %.2fs - %.2fs", mn, mx)
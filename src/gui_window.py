@@ -17,10 +17,12 @@ components via callbacks provided by ClickClickApp.
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import ctypes
+import functools
 import json
 import os
-import queue
 import threading
 import time
 import tkinter as tk
@@ -29,14 +31,46 @@ from tkinter import ttk
 from typing import Any, Callable, Optional, Tuple
 
 try:
-    # pynput is optional at runtime; GUI should still function without capture
-    from pynput.keyboard import Listener
+    # orjson parses/serializes several times faster than stdlib json; fall
+    # back transparently when it is not installed.
+    import orjson  # type: ignore
 except Exception:
-    Listener = None  # type: ignore
+    orjson = None  # type: ignore
 
 
 SETTINGS_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "settings.json"))
 
+# Parsed-settings cache keyed on path -> (mtime_ns, size, data). Skips the
+# disk read + JSON parse entirely when the file is unchanged on disk.
+_SETTINGS_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+
+def _read_settings_file(path: str = SETTINGS_FILE) -> Optional[dict]:
+    """Read and parse the settings file, serving unchanged files from cache.
+
+    Returns None when the file is missing or unreadable.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        if orjson is not None:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+    except Exception:
+        return None
+    if isinstance(data, dict):
+        _SETTINGS_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+        return data
+    return None
+
 SPACE_4 = 4
 SPACE_8 = 8
 SPACE_12 = 12
@@ -44,26 +78,124 @@ SPACE_16 = 16
 MIN_DELAY_SECONDS = 0.1
 MAX_DELAY_SECONDS = 20.0
 OFFSET_MAX_PX = 50
+# Cap on pending timer handles tracked per registry; see GUIWindow.__init__.
+_MAX_TIMER_HANDLES = 32
+
+# Every string the countdown label can show, precomputed once ("0.0 s"
+# through "99.9 s"); the 100 ms tick indexes this instead of formatting.
+_COUNTDOWN_STRS = tuple(f"{i / 10:0.1f} s" for i in range(1000))
+
+
+# sRGB decode table: channel byte -> linear-light value. Blending in linear
+# space is both correct (no muddy midpoints) and smoother, which is what
+# lets animate_color get away with fewer frames per fade.
+_SRGB_TO_LINEAR = tuple((i / 255.0) ** 2.2 for i in range(256))
+_INV_GAMMA = 1.0 / 2.2
+
+
+@functools.lru_cache(maxsize=512)
+def _hex_lerp_packed(ai: int, bi: int, t256: int) -> str:
+    # Decode via the LUT, lerp in linear light, re-encode. The gamma decode
+    # is a tuple index; only the encode pays a pow, and results are memoized.
+    lut = _SRGB_TO_LINEAR
+    t = t256 / 256.0
+    inv = 1.0 - t
+    r = round(255.0 * (lut[(ai >> 16) & 0xFF] * inv + lut[(bi >> 16) & 0xFF] * t) ** _INV_GAMMA)
+    g = round(255.0 * (lut[(ai >> 8) & 0xFF] * inv + lut[(bi >> 8) & 0xFF] * t) ** _INV_GAMMA)
+    b_ = round(255.0 * (lut[ai & 0xFF] * inv + lut[bi & 0xFF] * t) ** _INV_GAMMA)
+    return f"#{min(255, r):02X}{min(255, g):02X}{min(255, b_):02X}"
+
+
+@functools.lru_cache(maxsize=512)
+def _coerce_color_hex_cached(value: str, fallback: str) -> str:
+    """Normalize a hex color to 7-char uppercase form, memoized.
+
+    The palette is a small fixed set, so repeat coercions (every animation
+    and status-pill update) become cache hits instead of string work.
+    """
+    if value.startswith("#") and len(value) in {4, 7}:
+        if len(value) == 4:
+            r, g, b = value[1], value[2], value[3]
+            return f"#{r}{r}{g}{g}{b}{b}".upper()
+        return value.upper()
+    return fallback.upper()
+
+
+def pack_hex(color: str) -> int:
+    """Parse a '#RRGGBB' string into a packed 24-bit integer."""
+    return int(color.lstrip("#"), 16)
+
+
+def hex_lerp_packed(ai: int, bi: int, t: float) -> str:
+    """Interpolate between two packed-RGB ints; skips all string parsing.
+
+    Preferred on hot paths where the endpoints can be parsed once up front
+    (see Theme.__post_init__). Results are memoized with t quantized to
+    1/256.
+    """
+    return _hex_lerp_packed(ai, bi, max(0, min(256, int(t * 256 + 0.5))))
+
+
+def _precompute_hex_frames(from_hex: str, to_hex: str, steps: int) -> list[str]:
+    """Generate all interpolated frames for one animation in a single pass.
+
+    Parses the endpoints once, decodes each channel to linear light once,
+    and runs one tight loop over the step count — for long fades this beats
+    per-frame hex_lerp calls, which pay a parse and cache lookup each.
+    """
+    ai = pack_hex(from_hex)
+    bi = pack_hex(to_hex)
+    lut = _SRGB_TO_LINEAR
+    channels = [
+        (lut[(ai >> shift) & 0xFF], lut[(bi >> shift) & 0xFF])
+        for shift in (16, 8, 0)
+    ]
+    last = steps - 1
+    frames = []
+    for i in range(steps):
+        t = i / last
+        inv = 1.0 - t
+        r, g, b = (
+            min(255, round(255.0 * (a * inv + b_ * t) ** _INV_GAMMA))
+            for a, b_ in channels
+        )
+        frames.append(f"#{r:02X}{g:02X}{b:02X}")
+    return frames
 
 
 def hex_lerp(a: str, b: str, t: float) -> str:
-    """Interpolate between two hex colors."""
+    """Interpolate between two hex colors.
+
+    Results are memoized with t quantized to 1/256, so repeated theme or
+    animation blends of the same color pair are dictionary hits.
+    """
     a = a.lstrip("#")
     b = b.lstrip("#")
     if len(a) != 6 or len(b) != 6:
         return a if t <= 0 else b
-    t = max(0.0, min(1.0, t))
-    start = tuple(int(a[i : i + 2], 16) for i in range(0, 6, 2))
-    end = tuple(int(b[i : i + 2], 16) for i in range(0, 6, 2))
-    blended = tuple(int(round(s + (e - s) * t)) for s, e in zip(start, end))
-    return "#{:02X}{:02X}{:02X}".format(*blended)
+    return _hex_lerp_packed(int(a, 16), int(b, 16), max(0, min(256, int(t * 256 + 0.5))))
+
+
+def _tcl_value(value: Any) -> str:
+    """Render a Python style-option value as a Tcl word, bracing as needed."""
+    if isinstance(value, (tuple, list)):
+        return "{" + " ".join(_tcl_value(v) for v in value) + "}"
+    text = str(value)
+    if not text or " " in text:
+        return "{" + text + "}"
+    return text
 
 
 def apply_window_bg(root: tk.Misc, theme: "Theme" | None = None) -> None:
     """Ensure the base Tk window uses the theme background."""
     palette = theme or THEME
+    # Remember the last background written to this widget so repeat calls
+    # (window restore, settings reload) skip the Tcl round-trip.
+    if getattr(root, "_last_bg", None) == palette.window_bg:
+        return
     try:
         root.configure(bg=palette.window_bg)
+        root._last_bg = palette.window_bg  # type: ignore[attr-defined]
     except Exception:
         pass
 
@@ -83,6 +215,115 @@ class Theme:
     pill_idle_fg: str = "#F9FAFB"
     font_family: str = "Segoe UI"
 
+    def __post_init__(self) -> None:
+        # Derived colors and font tuples are computed once at construction
+        # instead of on every configure() call; object.__setattr__ is needed
+        # because the dataclass is frozen.
+        set_attr = object.__setattr__
+        # Packed-RGB forms of the palette, parsed once so every later blend
+        # (derived colors here, animations at runtime) skips string handling.
+        accent = pack_hex(self.accent)
+        danger = pack_hex(self.danger)
+        secondary = pack_hex(self.secondary_bg)
+        set_attr(self, "accent_rgb", accent)
+        set_attr(self, "danger_rgb", danger)
+        set_attr(self, "secondary_rgb", secondary)
+        set_attr(self, "strong_text_rgb", pack_hex(self.strong_text))
+        set_attr(self, "highlight_rgb", pack_hex(self.highlight))
+        set_attr(self, "accent_hover", hex_lerp_packed(accent, 0xFFFFFF, 0.12))
+        set_attr(self, "accent_active", hex_lerp_packed(accent, 0x000000, 0.2))
+        set_attr(self, "danger_hover", hex_lerp_packed(danger, 0xFFFFFF, 0.12))
+        set_attr(self, "danger_active", hex_lerp_packed(danger, 0x000000, 0.2))
+        set_attr(self, "secondary_hover", hex_lerp_packed(secondary, 0xFFFFFF, 0.08))
+        set_attr(self, "secondary_active", hex_lerp_packed(secondary, 0x000000, 0.12))
+        set_attr(self, "heading_font", (self.font_family, 16, "bold"))
+        set_attr(self, "card_heading_font", (self.font_family, 12, "bold"))
+        set_attr(self, "subtitle_font", (self.font_family, 10))
+        set_attr(self, "strong_font", (self.font_family, 11))
+        set_attr(self, "pill_font", (self.font_family, 9, "bold"))
+
+        # Data-driven style tables consumed by configure(); building them
+        # here keeps configure() itself to a flat loop of Tcl calls.
+        button_padding = (SPACE_16, SPACE_8)
+        body_font = (self.font_family, 10)
+        button_font = (self.font_family, 10, "bold")
+        small_font = (self.font_family, 9)
+        status_font = (self.font_family, 11, "bold")
+
+        # The three button styles share their configure/map shape; these
+        # build the spec entries so each style differs only in its palette.
+        def button_spec(name: str, bg: str, fg: str, font: tuple) -> tuple:
+            return name, {"background": bg, "foreground": fg, "font": font, "padding": button_padding}
+
+        def button_map_spec(name: str, hover: str, active: str, fg_disabled: str) -> tuple:
+            return name, {
+                "background": [("active", hover), ("pressed", active)],
+                "foreground": [("disabled", fg_disabled)],
+            }
+        set_attr(self, "_style_spec", (
+            ("Main.TFrame", {"background": self.window_bg}),
+            ("Header.TFrame", {"background": self.window_bg}),
+            ("Card.TFrame", {"background": self.card_bg, "relief": "flat", "borderwidth": 0}),
+            ("CardBody.TFrame", {"background": self.card_bg}),
+            ("TSeparator", {"background": self.secondary_bg}),
+            ("Header.TLabel", {"background": self.window_bg, "foreground": "#F9FAFB", "font": self.heading_font}),
+            ("Subtitle.TLabel", {"background": self.window_bg, "foreground": self.muted_text, "font": self.subtitle_font}),
+            ("CardHeading.TLabel", {"background": self.card_bg, "foreground": "#F9FAFB", "font": self.card_heading_font}),
+            ("Body.TLabel", {"background": self.card_bg, "foreground": self.body_text, "font": self.subtitle_font}),
+            ("Muted.TLabel", {"background": self.card_bg, "foreground": self.muted_text, "font": self.subtitle_font}),
+            ("Strong.TLabel", {"background": self.card_bg, "foreground": self.strong_text, "font": self.strong_font}),
+            ("Meta.TLabel", {"background": self.card_bg, "foreground": self.highlight, "font": small_font}),
+            ("Error.TLabel", {"background": self.card_bg, "foreground": "#F87171", "font": small_font}),
+            ("StatusActive.TLabel", {"background": self.card_bg, "foreground": "#34D399", "font": status_font}),
+            ("StatusInactive.TLabel", {"background": self.card_bg, "foreground": "#F87171", "font": status_font}),
+            ("Pill.TLabel", {
+                "background": self.pill_idle_bg,
+                "foreground": self.pill_idle_fg,
+                "font": self.pill_font,
+                "padding": (SPACE_8, SPACE_4),
+            }),
+            button_spec("Primary.TButton", self.accent, "#F9FAFB", button_font),
+            button_spec("Danger.TButton", self.danger, "#F9FAFB", button_font),
+            button_spec("Secondary.TButton", self.secondary_bg, self.body_text, body_font),
+            ("Toggle.TCheckbutton", {
+                "background": self.card_bg,
+                "foreground": self.body_text,
+                "font": body_font,
+            }),
+            ("Input.Spinbox", {
+                "background": self.card_bg,
+                "foreground": "#F9FAFB",
+                "fieldbackground": self.secondary_bg,
+                "arrowsize": 12,
+            }),
+            ("ValidationError.TFrame", {"background": "#7F1D1D", "borderwidth": 0, "relief": "flat"}),
+            ("ValidationError.TLabel", {
+                "background": "#7F1D1D",
+                "foreground": "#FEE2E2",
+                "font": button_font,
+            }),
+        ))
+        set_attr(self, "_style_map_spec", (
+            button_map_spec("Primary.TButton", self.accent_hover, self.accent_active, self.muted_text),
+            button_map_spec("Danger.TButton", self.danger_hover, self.danger_active, "#FECACA"),
+            button_map_spec("Secondary.TButton", self.secondary_hover, self.secondary_active, self.muted_text),
+            ("Toggle.TCheckbutton", {"foreground": [("disabled", self.muted_text)]}),
+        ))
+
+        # Single Tcl script equivalent of the two specs: one eval replaces
+        # the ~30 individually marshalled style calls on the startup path.
+        lines = []
+        for name, cfg in self._style_spec:
+            opts = " ".join(f"-{opt} {_tcl_value(val)}" for opt, val in cfg.items())
+            lines.append(f"ttk::style configure {name} {opts}")
+        for name, cfg in self._style_map_spec:
+            opts = " ".join(
+                "-%s {%s}" % (opt, " ".join(f"{state} {_tcl_value(val)}" for state, val in pairs))
+                for opt, pairs in cfg.items()
+            )
+            lines.append(f"ttk::style map {name} {opts}")
+        set_attr(self, "_style_script", "\n".join(lines))
+
     def configure(self, root: tk.Misc, style: ttk.Style) -> None:
         apply_window_bg(root, self)
         try:
@@ -90,107 +331,22 @@ class Theme:
         except tk.TclError:
             pass
 
-        accent_hover = hex_lerp(self.accent, "#FFFFFF", 0.12)
-        accent_active = hex_lerp(self.accent, "#000000", 0.2)
-        danger_hover = hex_lerp(self.danger, "#FFFFFF", 0.12)
-        danger_active = hex_lerp(self.danger, "#000000", 0.2)
-        secondary_hover = hex_lerp(self.secondary_bg, "#FFFFFF", 0.08)
-        secondary_active = hex_lerp(self.secondary_bg, "#000000", 0.12)
-
-        style.configure("Main.TFrame", background=self.window_bg)
-        style.configure("Header.TFrame", background=self.window_bg)
-        style.configure("Card.TFrame", background=self.card_bg, relief="flat", borderwidth=0)
-        style.configure("CardBody.TFrame", background=self.card_bg)
-        style.configure("TSeparator", background=self.secondary_bg)
-
-        heading_font = (self.font_family, 16, "bold")
-        card_heading_font = (self.font_family, 12, "bold")
-        subtitle_font = (self.font_family, 10)
-        strong_font = (self.font_family, 11)
-        pill_font = (self.font_family, 9, "bold")
-
-        style.configure("Header.TLabel", background=self.window_bg, foreground="#F9FAFB", font=heading_font)
-        style.configure("Subtitle.TLabel", background=self.window_bg, foreground=self.muted_text, font=subtitle_font)
-        style.configure("CardHeading.TLabel", background=self.card_bg, foreground="#F9FAFB", font=card_heading_font)
-        style.configure("Body.TLabel", background=self.card_bg, foreground=self.body_text, font=subtitle_font)
-        style.configure("Muted.TLabel", background=self.card_bg, foreground=self.muted_text, font=subtitle_font)
-        style.configure("Strong.TLabel", background=self.card_bg, foreground=self.strong_text, font=strong_font)
-        style.configure("Meta.TLabel", background=self.card_bg, foreground=self.highlight, font=(self.font_family, 9))
-        style.configure("Error.TLabel", background=self.card_bg, foreground="#F87171", font=(self.font_family, 9))
-        style.configure("StatusActive.TLabel", background=self.card_bg, foreground="#34D399", font=(self.font_family, 11, "bold"))
-        style.configure("StatusInactive.TLabel", background=self.card_bg, foreground="#F87171", font=(self.font_family, 11, "bold"))
-        style.configure(
-            "Pill.TLabel",
-            background=self.pill_idle_bg,
-            foreground=self.pill_idle_fg,
-            font=pill_font,
-            padding=(SPACE_8, SPACE_4),
-        )
-
-        button_padding = (SPACE_16, SPACE_8)
-        style.configure(
-            "Primary.TButton",
-            background=self.accent,
-            foreground="#F9FAFB",
-            font=(self.font_family, 10, "bold"),
-            padding=button_padding,
-        )
-        style.map(
-            "Primary.TButton",
-            background=[("active", accent_hover), ("pressed", accent_active)],
-            foreground=[("disabled", self.muted_text)],
-        )
-        style.configure(
-            "Danger.TButton",
-            background=self.danger,
-            foreground="#F9FAFB",
-            font=(self.font_family, 10, "bold"),
-            padding=button_padding,
-        )
-        style.map(
-            "Danger.TButton",
-            background=[("active", danger_hover), ("pressed", danger_active)],
-            foreground=[("disabled", "#FECACA")],
-        )
-        style.configure(
-            "Secondary.TButton",
-            background=self.secondary_bg,
-            foreground=self.body_text,
-            font=(self.font_family, 10),
-            padding=button_padding,
-        )
-        style.map(
-            "Secondary.TButton",
-            background=[("active", secondary_hover), ("pressed", secondary_active)],
-            foreground=[("disabled", self.muted_text)],
-        )
-
-        style.configure("Toggle.TCheckbutton", background=self.card_bg, foreground=self.body_text, font=(self.font_family, 10))
-        style.map("Toggle.TCheckbutton", foreground=[("disabled", self.muted_text)])
-
         spinbox_layout = style.layout("TSpinbox")
         if spinbox_layout:
             style.layout("Input.Spinbox", spinbox_layout)
-        style.configure(
-            "Input.Spinbox",
-            background=self.card_bg,
-            foreground="#F9FAFB",
-            fieldbackground=self.secondary_bg,
-            arrowsize=12,
-        )
-        style.configure(
-            "ValidationError.TFrame",
-            background="#7F1D1D",
-            borderwidth=0,
-            relief="flat",
-        )
-        style.configure(
-            "ValidationError.TLabel",
-            background="#7F1D1D",
-            foreground="#FEE2E2",
-            font=(self.font_family, 10, "bold"),
-        )
 
+        # Apply both specs with one Tcl eval instead of ~30 marshalled
+        # style calls; fall back to the per-call loop if the generated
+        # script is rejected.
+        try:
+            root.tk.eval(self._style_script)
+        except tk.TclError:
+            conf = style.configure
+            for name, cfg in self._style_spec:
+                conf(name, **cfg)
+            map_ = style.map
+            for name, cfg in self._style_map_spec:
+                map_(name, **cfg)
 
 THEME = Theme()
 
@@ -208,6 +364,20 @@ class GUIWindow:
         self.app = app
         self.parent_root = parent_root
 
+        # Resolve the config module once instead of re-importing (with the
+        # package/flat fallback dance) at every debug-print or toggle site.
+        try:
+            import src.config as _cfg  # type: ignore
+        except Exception:
+            try:
+                import config as _cfg  # type: ignore
+            except Exception:
+                _cfg = None
+        self._cfg = _cfg
+        # Bound debug printer: print when console output is on, a no-op
+        # otherwise, so disabled call sites cost one local call.
+        self._refresh_debug_printer()
+
         self._configure_dpi_awareness()
 
         # Create the window attached to the shared root if provided
@@ -216,6 +386,12 @@ class GUIWindow:
         else:
             self.window = tk.Tk()
 
+        # Pre-bound timer methods: the debounce, UI pump, countdown, and
+        # animation paths call these many times per second, and a bound
+        # method in an instance slot skips the window attribute hop.
+        self._after = self.window.after
+        self._after_cancel = self.window.after_cancel
+
         self._configure_tk_scaling()
 
         # Basic window configuration
@@ -233,6 +409,7 @@ class GUIWindow:
 
         # Widgets and style references (assigned during layout build)
         self.style: Optional[ttk.Style] = None
+        self._layout_container: Optional[ttk.Frame] = None
         self.status_value_label: Optional[ttk.Label] = None
         self.position_label: Optional[ttk.Label] = None
         self.start_stop_button: Optional[ttk.Button] = None
@@ -241,7 +418,72 @@ class GUIWindow:
         self.applied_delay_label: Optional[ttk.Label] = None
         self._offset_display_label: Optional[ttk.Label] = None
         self._offset_scale: Optional[ttk.Scale] = None
-        self._in_offset_update = False
+        # Centralized widget-destroyed guard: the only way a post-build
+        # setter can fail is the close race, so callbacks check this flag
+        # instead of each wrapping a single Tk call in try/except.
+        self._destroyed = False
+        # Set while load_settings bulk-assigns vars; trace callbacks early
+        # return so six .set() calls don't mean six validation passes.
+        self._loading = False
+        # Last values actually pushed to the window manager / indicator
+        # window; the apply handlers no-op on equality.
+        self._applied_topmost: Optional[bool] = None
+        self._applied_show_indicator: Optional[bool] = None
+        # Status redraw-rate gate state: newest requested args, the pending
+        # trailing-flush handle, and when the last flush actually ran.
+        self._next_status_args: Optional[Tuple[bool, Optional[Tuple[int, int]]]] = None
+        self._status_after: Optional[str] = None
+        self._last_status_tick = 0.0
+        # Last-seen values used to short-circuit no-op trace callbacks
+        # (Tk fires traces on focus changes and programmatic sets too).
+        self._last_validated_timing: Optional[Tuple[float, float]] = None
+        self._last_offset: Optional[int] = None
+        # Offset value last pushed to the backend; the debounced apply path
+        # no-ops when asked to re-apply it.
+        self._last_applied_offset: Optional[int] = None
+        # Python-side mirrors of what the offset var and scale currently
+        # hold, so _set_offset's "already shows this?" checks are attribute
+        # loads instead of Var.get/Scale.get Tcl round-trips. None means
+        # unknown (not built yet, or the var holds unparseable text).
+        self._offset_var_value: Optional[int] = None
+        self._offset_scale_value: Optional[int] = None
+        # Offset value parked by scale drags; flushed once per idle cycle so
+        # only the newest position does any downstream work.
+        self._offset_pending: Optional[int] = None
+        self._offset_idle_id: Optional[str] = None
+        # Value last rendered by _update_offset_display.
+        self._last_offset_displayed: Optional[int] = None
+        # Last text written per label key; identical rewrites are skipped so
+        # steady-state ticks don't cross into Tcl at all.
+        self._last_label_texts: dict[str, str] = {}
+        # Pre-bound .configure methods for the hot-path widgets, assigned by
+        # _cache_widget_configures after each build phase.
+        self._status_value_configure: Optional[Callable[..., Any]] = None
+        self._status_message_configure: Optional[Callable[..., Any]] = None
+        self._pill_configure: Optional[Callable[..., Any]] = None
+        self._position_configure: Optional[Callable[..., Any]] = None
+        self._countdown_configure: Optional[Callable[..., Any]] = None
+        self._start_stop_configure: Optional[Callable[..., Any]] = None
+        self._applied_delay_configure: Optional[Callable[..., Any]] = None
+        self._offset_display_configure: Optional[Callable[..., Any]] = None
+        # Serialized form of the last saved settings; a matching blob means
+        # save_settings can return without touching disk.
+        self._last_saved_blob: Optional[bytes] = None
+        # Settings writes run on a single background worker with the newest
+        # pending payload coalesced under the lock, keeping disk latency off
+        # the Tk thread.
+        self._save_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="settings"
+        )
+        self._save_lock = threading.Lock()
+        self._pending_save: Optional[tuple[bytes, dict]] = None
+        self._save_future: Optional[concurrent.futures.Future] = None
+        # Last pushed (is_active, locked_position) pair and start/stop
+        # button style; identical status updates skip all widget writes.
+        self._last_status_state: Optional[Tuple[bool, Optional[Tuple[int, int]]]] = None
+        self._last_button_style: Optional[str] = None
+        # Last background written to the status pill (avoids a cget).
+        self._last_status_pill_bg: Optional[str] = None
         self.status_pill_label: Optional[tk.Label] = None
         self.status_message_label: Optional[ttk.Label] = None
         self.version_label: Optional[ttk.Label] = None
@@ -250,18 +492,44 @@ class GUIWindow:
         self.validation_banner_label: Optional[ttk.Label] = None
 
         self.theme = THEME
-        self._debounce_handles: dict[str, str] = {}
-        self._ui_event_queue: queue.Queue[Callable[[], None]] = queue.Queue()
+        # Theme instance last pushed through ttk styles; _apply_theme no-ops
+        # while this matches self.theme.
+        self._applied_theme: Optional[Theme] = None
+        # Timer handles keyed by purpose. Ordered with a hard cap so orphan
+        # entries (after_cancel failures, mid-flight destroys) cannot pile
+        # up; the oldest entry is cancelled and evicted at the cap.
+        self._debounce_handles: collections.OrderedDict[str, str] = collections.OrderedDict()
+        # Pending UI callbacks: a deque guarded by a lock only long enough
+        # to swap it out wholesale, so draining never holds the lock while
+        # callbacks run and the empty check is a plain truthiness test.
+        self._ui_event_queue: collections.deque[Callable[[], None]] = collections.deque()
+        self._ui_event_lock = threading.Lock()
+        # __init__ runs on the Tk thread; calls posted from it skip the
+        # queue entirely.
+        self._ui_thread_id = threading.get_ident()
         self._ui_event_after: Optional[str] = None
-        self._animation_handles: dict[str, str] = {}
+        self._animation_handles: collections.OrderedDict[str, str] = collections.OrderedDict()
+        # Smoothed animation tick cost in seconds (EMA); animate_color
+        # deducts it from each frame budget when scheduling the next tick.
+        self._anim_cost_ema: float = 0.0
+        # Last target color scheduled per animation key; a repeat request
+        # toward the same target is dropped without touching Tcl.
+        self._animation_targets: dict[str, str] = {}
         self._is_running = False
-        self._status_pill_colors: dict[str, tuple[str, str]] = {
-            "idle": (self.theme.pill_idle_bg, self.theme.pill_idle_fg),
-            "running": ("#064E3B", "#ECFDF5"),
-        }
+        # Pill palettes as two plain attributes selected by the boolean;
+        # backgrounds pre-normalized to uppercase so state compares are
+        # direct string equality.
+        self._status_pill_idle: Tuple[str, str] = (
+            _coerce_color_hex_cached(self.theme.pill_idle_bg, "#000000"),
+            self.theme.pill_idle_fg,
+        )
+        self._status_pill_running: Tuple[str, str] = ("#064E3B", "#ECFDF5")
         self._countdown_target_ts: Optional[float] = None
         self._countdown_after: Optional[str] = None
         self._validation_messages: dict[str, str] = {}
+        # Key of the most recently set message; read by the banner refresh
+        # instead of scanning the dict from the end.
+        self._latest_validation_key: Optional[str] = None
         self._validation_banner_visible = False
 
         self.min_delay_var = tk.DoubleVar(value=8.0)
@@ -276,6 +544,9 @@ class GUIWindow:
         self.hotkey_vk: Optional[int] = 101
         self.hotkey_char: Optional[str] = None
         self.hotkey_name: Optional[str] = None
+        # Serialized form cached whenever the hotkey changes, so each
+        # save_settings reads a dict instead of redoing isinstance checks.
+        self._hotkey_serialized: dict = {"vk": 101, "char": None, "name": None}
 
         # Ensure closing the window exits the app entirely
         try:
@@ -287,18 +558,18 @@ class GUIWindow:
         self._build_layout()
         self._bind_behaviors()
         self._start_ui_event_pump()
-        self._validate_timing_inputs()
-        self._on_offset_var_changed()
 
-        # Load settings after widgets exist
-        self.load_settings()
+        # Read settings off the Tk thread: the window renders its defaults
+        # immediately and the parsed values (plus the single backend flush)
+        # arrive through the UI event queue once the disk read completes.
+        self._save_executor.submit(self._load_settings_async)
 
-        # Apply initial component values to backend
+    def _flush_all_settings(self) -> None:
+        """Push every loaded setting to the backend exactly once."""
         self._apply_delay_settings()
         self._apply_offset_settings()
         self._apply_always_on_top()
         self._apply_show_indicator()
-        # Push hotkey to handler
         self._apply_hotkey_to_handler()
 
     def _configure_dpi_awareness(self) -> None:
@@ -329,48 +600,60 @@ class GUIWindow:
 
     # Layout construction
     def _apply_theme(self) -> None:
+        # Re-applying an unchanged theme would re-dispatch every style
+        # configure/map call; identity is enough since Theme is frozen.
+        if self._applied_theme is self.theme:
+            return
         self.style = ttk.Style(self.window)
         try:
             self.style.theme_use("clam")
         except tk.TclError:
             pass
         self.theme.configure(self.window, self.style)
+        self._applied_theme = self.theme
 
     def _create_card(self, parent: ttk.Frame, title: str) -> ttk.Frame:
-        card = ttk.Frame(parent, style="Card.TFrame", padding=(SPACE_16, SPACE_16))
+        # Widget constructors as locals: the builders below create dozens of
+        # widgets, and LOAD_FAST beats the ttk-module attribute chain per call.
+        Frame = ttk.Frame
+        Label = ttk.Label
+        Separator = ttk.Separator
+        card = Frame(parent, style="Card.TFrame", padding=(SPACE_16, SPACE_16))
         card.pack(fill="x", pady=(0, SPACE_16))
 
-        ttk.Label(card, text=title, style="CardHeading.TLabel").pack(anchor="w")
-        ttk.Separator(card).pack(fill="x", pady=(SPACE_8, SPACE_12))
+        Label(card, text=title, style="CardHeading.TLabel").pack(anchor="w")
+        Separator(card).pack(fill="x", pady=(SPACE_8, SPACE_12))
 
-        body = ttk.Frame(card, style="CardBody.TFrame")
+        body = Frame(card, style="CardBody.TFrame")
         body.pack(fill="x")
         return body
 
     def _build_header_bar(self, parent: ttk.Frame) -> None:
-        header = ttk.Frame(parent, style="Header.TFrame", padding=(SPACE_16, SPACE_12))
+        Frame = ttk.Frame
+        Label = ttk.Label
+        header = Frame(parent, style="Header.TFrame", padding=(SPACE_16, SPACE_12))
         header.pack(fill="x", pady=(0, SPACE_16))
 
-        text_area = ttk.Frame(header, style="Header.TFrame")
+        text_area = Frame(header, style="Header.TFrame")
         text_area.pack(side="left", fill="both", expand=True)
 
-        title_row = ttk.Frame(text_area, style="Header.TFrame")
+        title_row = Frame(text_area, style="Header.TFrame")
         title_row.pack(fill="x")
-        ttk.Label(title_row, text=self._resolve_app_name(), style="Header.TLabel").pack(side="left", anchor="w")
+        Label(title_row, text=self._resolve_app_name(), style="Header.TLabel").pack(side="left", anchor="w")
 
         version = self._resolve_version_text()
         if version:
-            self.version_label = ttk.Label(title_row, text=version, style="Subtitle.TLabel")
+            self.version_label = Label(title_row, text=version, style="Subtitle.TLabel")
             self.version_label.pack(side="left", padx=(SPACE_8, 0))
 
-        self.status_message_label = ttk.Label(
+        self.status_message_label = Label(
             text_area,
             text="Automation idle",
             style="Subtitle.TLabel",
         )
         self.status_message_label.pack(anchor="w", pady=(SPACE_4, 0))
 
-        pill_bg, pill_fg = self._status_pill_colors["idle"]
+        pill_bg, pill_fg = self._status_pill_idle
         self.status_pill_label = tk.Label(
             header,
             text="Idle",
@@ -385,35 +668,40 @@ class GUIWindow:
         self.status_pill_label.pack(side="right", anchor="e")
 
     def _build_validation_banner(self, parent: ttk.Frame) -> None:
-        holder = ttk.Frame(parent, style="Main.TFrame")
+        Frame = ttk.Frame
+        Label = ttk.Label
+        holder = Frame(parent, style="Main.TFrame")
         holder.pack(fill="x")
-        banner = ttk.Frame(holder, style="ValidationError.TFrame", padding=(SPACE_12, SPACE_8))
+        banner = Frame(holder, style="ValidationError.TFrame", padding=(SPACE_12, SPACE_8))
         self.validation_banner_frame = banner
-        ttk.Label(banner, text="!", style="ValidationError.TLabel").pack(side="left", padx=(0, SPACE_8))
-        self.validation_banner_label = ttk.Label(banner, text="", style="ValidationError.TLabel")
+        Label(banner, text="!", style="ValidationError.TLabel").pack(side="left", padx=(0, SPACE_8))
+        self.validation_banner_label = Label(banner, text="", style="ValidationError.TLabel")
         self.validation_banner_label.pack(side="left", fill="x", expand=True)
 
     def _build_status_card(self, container: ttk.Frame) -> None:
+        Frame = ttk.Frame
+        Label = ttk.Label
+        Button = ttk.Button
         status_body = self._create_card(container, "Live Status")
         status_body.columnconfigure(0, weight=1)
         status_body.columnconfigure(1, weight=1)
 
-        ttk.Label(status_body, text="Status", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
-        self.status_value_label = ttk.Label(status_body, text="Inactive", style="StatusInactive.TLabel")
+        Label(status_body, text="Status", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
+        self.status_value_label = Label(status_body, text="Inactive", style="StatusInactive.TLabel")
         self.status_value_label.grid(row=0, column=1, sticky="e")
 
-        ttk.Label(status_body, text="Position", style="Muted.TLabel").grid(row=1, column=0, sticky="w", pady=(SPACE_8, 0))
-        self.position_label = ttk.Label(status_body, text="Not Locked", style="Strong.TLabel")
+        Label(status_body, text="Position", style="Muted.TLabel").grid(row=1, column=0, sticky="w", pady=(SPACE_8, 0))
+        self.position_label = Label(status_body, text="Not Locked", style="Strong.TLabel")
         self.position_label.grid(row=1, column=1, sticky="e", pady=(SPACE_8, 0))
 
-        countdown_row = ttk.Frame(status_body, style="CardBody.TFrame")
+        countdown_row = Frame(status_body, style="CardBody.TFrame")
         countdown_row.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(SPACE_12, 0))
         countdown_row.columnconfigure(0, weight=1)
-        ttk.Label(countdown_row, text="Next Click", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
-        self.countdown_value_label = ttk.Label(countdown_row, text="--.- s", style="Strong.TLabel")
+        Label(countdown_row, text="Next Click", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
+        self.countdown_value_label = Label(countdown_row, text="--.- s", style="Strong.TLabel")
         self.countdown_value_label.grid(row=0, column=1, sticky="e")
 
-        self.start_stop_button = ttk.Button(
+        self.start_stop_button = Button(
             status_body,
             text="Start Auto-Clicker",
             command=self._on_toggle_clicked,
@@ -423,15 +711,21 @@ class GUIWindow:
         self._start_countdown_loop()
 
     def _build_timing_card(self, container: ttk.Frame) -> None:
+        Label = ttk.Label
+        Button = ttk.Button
+        Spinbox = ttk.Spinbox
         timing_body = self._create_card(container, "Click Timing")
         timing_body.columnconfigure(0, weight=1)
         timing_body.columnconfigure(1, weight=1)
         timing_body.columnconfigure(2, weight=1)
 
-        ttk.Label(timing_body, text="Min Delay (sec)", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
-        ttk.Label(timing_body, text="Max Delay (sec)", style="Muted.TLabel").grid(row=1, column=0, sticky="w", pady=(SPACE_12, 0))
+        Label(timing_body, text="Min Delay (sec)", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
+        Label(timing_body, text="Max Delay (sec)", style="Muted.TLabel").grid(row=1, column=0, sticky="w", pady=(SPACE_12, 0))
 
-        ttk.Spinbox(
+        # Validation runs on commit events (focus-out, Return, arrow clicks)
+        # rather than a per-keystroke var trace, so typing "12.5" costs one
+        # validation pass instead of four.
+        min_spin = Spinbox(
             timing_body,
             from_=MIN_DELAY_SECONDS,
             to=MAX_DELAY_SECONDS,
@@ -441,9 +735,11 @@ class GUIWindow:
             justify="center",
             style="Input.Spinbox",
             format="%.1f",
-        ).grid(row=0, column=1, sticky="w", padx=(SPACE_12, 0))
+            command=self._validate_timing_inputs,
+        )
+        min_spin.grid(row=0, column=1, sticky="w", padx=(SPACE_12, 0))
 
-        ttk.Spinbox(
+        max_spin = Spinbox(
             timing_body,
             from_=MIN_DELAY_SECONDS,
             to=MAX_DELAY_SECONDS,
@@ -453,9 +749,15 @@ class GUIWindow:
             justify="center",
             style="Input.Spinbox",
             format="%.1f",
-        ).grid(row=1, column=1, sticky="w", padx=(SPACE_12, 0), pady=(SPACE_12, 0))
+            command=self._validate_timing_inputs,
+        )
+        max_spin.grid(row=1, column=1, sticky="w", padx=(SPACE_12, 0), pady=(SPACE_12, 0))
+
+        for spin in (min_spin, max_spin):
+            spin.bind("<FocusOut>", self._on_timing_commit)
+            spin.bind("<Return>", self._on_timing_commit)
 
-        self.apply_timing_button = ttk.Button(
+        self.apply_timing_button = Button(
             timing_body,
             text="Apply Timing",
             command=self._apply_delay_settings,
@@ -463,20 +765,26 @@ class GUIWindow:
         )
         self.apply_timing_button.grid(row=0, column=2, rowspan=2, sticky="ew", padx=(SPACE_16, 0))
 
-        self.timing_error_label = ttk.Label(timing_body, text="", style="Error.TLabel")
+        self.timing_error_label = Label(timing_body, text="", style="Error.TLabel")
         self.timing_error_label.grid(row=2, column=0, columnspan=3, sticky="w", pady=(SPACE_12, 0))
 
-        self.applied_delay_label = ttk.Label(timing_body, text="Applied: Min 1s, Max 3s", style="Meta.TLabel")
+        self.applied_delay_label = Label(timing_body, text="Applied: Min 1s, Max 3s", style="Meta.TLabel")
         self.applied_delay_label.grid(row=3, column=0, columnspan=3, sticky="w", pady=(SPACE_8, 0))
 
     def _build_offset_card(self, container: ttk.Frame) -> None:
+        Label = ttk.Label
+        Spinbox = ttk.Spinbox
         offset_body = self._create_card(container, "Position Offset")
         offset_body.columnconfigure(0, weight=1)
         offset_body.columnconfigure(1, weight=1)
 
-        ttk.Label(offset_body, text="Randomize each click within:", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
-        self._offset_display_label = ttk.Label(offset_body, text="±3 px", style="Strong.TLabel")
+        Label(offset_body, text="Randomize each click within:", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
+        self._offset_display_label = Label(offset_body, text="±3 px", style="Strong.TLabel")
         self._offset_display_label.grid(row=0, column=1, sticky="e")
+        # Bind the configure slot right away: the next line renders through
+        # it, and the async settings load means _cache_widget_configures may
+        # not have run yet when this builder executes.
+        self._offset_display_configure = self._offset_display_label.configure
         self._update_offset_display(self.offset_range_var.get())
 
         self._offset_scale = ttk.Scale(
@@ -492,7 +800,9 @@ class GUIWindow:
         except Exception:
             pass
 
-        ttk.Spinbox(
+        # Out-of-range keystrokes are rejected Tcl-side before the var ever
+        # changes, so the trace never runs for input the clamp would discard.
+        Spinbox(
             offset_body,
             from_=0,
             to=OFFSET_MAX_PX,
@@ -501,68 +811,76 @@ class GUIWindow:
             width=6,
             justify="center",
             style="Input.Spinbox",
+            validate="key",
+            validatecommand=(self.window.register(self._offset_key_valid), "%P"),
         ).grid(row=2, column=0, sticky="w", pady=(SPACE_12, 0))
-        ttk.Label(offset_body, text="Use the arrows or slider for fine control.", style="Meta.TLabel").grid(
+        Label(offset_body, text="Use the arrows or slider for fine control.", style="Meta.TLabel").grid(
             row=2, column=1, sticky="e", pady=(SPACE_12, 0)
         )
 
     def _build_behavior_card(self, container: ttk.Frame) -> None:
+        Checkbutton = ttk.Checkbutton
         behavior_body = self._create_card(container, "Behavior & Visibility")
-        behavior_body.columnconfigure(0, weight=1)
 
-        ttk.Checkbutton(
+        # Plain vertical stack: pack is a cheaper geometry manager than grid
+        # here (no row/column bookkeeping for a one-column list).
+        Checkbutton(
             behavior_body,
             text="Show Status Indicator",
             variable=self.show_indicator_var,
             command=self._apply_show_indicator,
             style="Toggle.TCheckbutton",
-        ).grid(row=0, column=0, sticky="w")
-        ttk.Checkbutton(
+        ).pack(anchor="w")
+        Checkbutton(
             behavior_body,
             text="Always On Top",
             variable=self.always_on_top_var,
             command=self._apply_always_on_top,
             style="Toggle.TCheckbutton",
-        ).grid(row=1, column=0, sticky="w", pady=(SPACE_8, 0))
-        ttk.Checkbutton(
+        ).pack(anchor="w", pady=(SPACE_8, 0))
+        Checkbutton(
             behavior_body,
             text="Console Debug Output",
             variable=self.console_output_var,
             command=self._apply_console_output,
             style="Toggle.TCheckbutton",
-        ).grid(row=2, column=0, sticky="w", pady=(SPACE_8, 0))
+        ).pack(anchor="w", pady=(SPACE_8, 0))
 
     def _build_hotkey_card(self, container: ttk.Frame) -> None:
+        Label = ttk.Label
+        Button = ttk.Button
         hotkey_body = self._create_card(container, "Toggle Hotkey")
         hotkey_body.columnconfigure(0, weight=1)
         hotkey_body.columnconfigure(1, weight=1)
 
-        ttk.Label(hotkey_body, text="Current Hotkey", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
-        ttk.Label(hotkey_body, textvariable=self.hotkey_var, style="Strong.TLabel").grid(
+        Label(hotkey_body, text="Current Hotkey", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
+        Label(hotkey_body, textvariable=self.hotkey_var, style="Strong.TLabel").grid(
             row=1, column=0, sticky="w", pady=(SPACE_8, 0)
         )
-        ttk.Button(hotkey_body, text="Capture New Hotkey", command=self._capture_hotkey, style="Secondary.TButton").grid(
+        Button(hotkey_body, text="Capture New Hotkey", command=self._capture_hotkey, style="Secondary.TButton").grid(
             row=1, column=1, sticky="e", pady=(SPACE_8, 0)
         )
-        ttk.Label(
+        Label(
             hotkey_body,
             text="Hotkeys apply immediately after capture.",
             style="Meta.TLabel",
         ).grid(row=2, column=0, columnspan=2, sticky="w", pady=(SPACE_12, 0))
 
     def _build_footer(self, container: ttk.Frame) -> None:
-        footer = ttk.Frame(container, style="Main.TFrame")
+        Frame = ttk.Frame
+        Button = ttk.Button
+        footer = Frame(container, style="Main.TFrame")
         footer.pack(fill="x", pady=(SPACE_8, 0))
         footer.columnconfigure(0, weight=1)
         footer.columnconfigure(1, weight=1)
 
-        ttk.Button(
+        Button(
             footer,
             text="Minimize to Indicator",
             command=self.minimize_to_indicator,
             style="Secondary.TButton",
         ).grid(row=0, column=0, sticky="w")
-        ttk.Button(
+        Button(
             footer,
             text="Save Settings",
             command=self.save_settings,
@@ -591,37 +909,102 @@ class GUIWindow:
     def _build_layout(self) -> None:
         root = self.window
 
+        # The window geometry is fixed (520x800, non-resizable), so child
+        # packs never need to renegotiate the toplevel's size; freezing
+        # propagation spares one requested-size recomputation per widget
+        # added during the build.
+        try:
+            root.pack_propagate(False)
+        except Exception:
+            pass
+
         container = ttk.Frame(root, style="Main.TFrame", padding=SPACE_16 + SPACE_8)
         container.pack(fill="both", expand=True)
+        self._layout_container = container
 
+        # Critical path: only what the first paint needs. The remaining
+        # cards are scheduled for the first idle pass after the window maps,
+        # so the window appears before most of the widget tree exists.
         self._build_validation_banner(container)
         self._build_header_bar(container)
         self._build_status_card(container)
+        self._cache_widget_configures()
+
+        self.window.after_idle(self._build_layout_deferred)
+
+    def _cache_widget_configures(self) -> None:
+        # Bind the hot-path widgets' configure methods into instance slots
+        # so update paths skip the widget attribute hop per call.
+        for widget_attr, slot in (
+            ("status_value_label", "_status_value_configure"),
+            ("status_message_label", "_status_message_configure"),
+            ("status_pill_label", "_pill_configure"),
+            ("position_label", "_position_configure"),
+            ("countdown_value_label", "_countdown_configure"),
+            ("start_stop_button", "_start_stop_configure"),
+            ("applied_delay_label", "_applied_delay_configure"),
+            ("_offset_display_label", "_offset_display_configure"),
+        ):
+            widget = getattr(self, widget_attr, None)
+            if widget is not None:
+                setattr(self, slot, widget.configure)
+
+    def _build_layout_deferred(self) -> None:
+        # Built off the first-paint critical path; every _apply_*/validation
+        # helper already guards against widgets that don't exist yet, so any
+        # update that fired before this ran was simply dropped.
+        container = self._layout_container
         self._build_timing_card(container)
         self._build_offset_card(container)
         self._build_behavior_card(container)
         self._build_hotkey_card(container)
         self._build_footer(container)
+        self._cache_widget_configures()
+
+        # Re-render displays whose updates were dropped while their widgets
+        # were missing.
+        try:
+            self._last_validated_timing = None
+            self._validate_timing_inputs()
+            # Pre-build calls may have recorded a value without a widget to
+            # render it; clear the cache so this render actually happens.
+            self._last_offset_displayed = None
+            self._update_offset_display(int(self.offset_range_var.get()))
+            self._update_applied_delay_label(
+                self._clamp_delay_value(self.min_delay_var.get()),
+                self._clamp_delay_value(self.max_delay_var.get()),
+            )
+        except Exception:
+            pass
+
+        # One idle pass settles the whole deferred batch's layout instead of
+        # leaving it to trickle through later events.
+        try:
+            self.window.update_idletasks()
+        except Exception:
+            pass
 
     def _bind_behaviors(self) -> None:
+        try:
+            self.window.bind("<Destroy>", self._cancel_all_after)
+        except Exception:
+            pass
         try:
             self.offset_range_var.trace_add("write", lambda *args: self._on_offset_var_changed())
-            self.min_delay_var.trace_add(
-                "write",
-                lambda *args: self.debounce("timing_validation", 150, self._validate_timing_inputs),
-            )
-            self.max_delay_var.trace_add(
-                "write",
-                lambda *args: self.debounce("timing_validation", 150, self._validate_timing_inputs),
-            )
+            # Delay vars deliberately have no write trace: validation is
+            # bound to the spinboxes' commit events instead (focus-out,
+            # Return, and arrow clicks in _build_timing_card).
         except Exception:
             pass
 
+    def _on_timing_commit(self, event: Optional[tk.Event] = None) -> None:
+        self._validate_timing_inputs()
+
     def debounce(self, key: str, delay_ms: int, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
         handle = self._debounce_handles.get(key)
         if handle is not None:
             try:
-                self.window.after_cancel(handle)
+                self._after_cancel(handle)
             except Exception:
                 pass
 
@@ -630,37 +1013,102 @@ class GUIWindow:
             func(*args, **kwargs)
 
         try:
-            self._debounce_handles[key] = self.window.after(delay_ms, _invoke)
+            self._debounce_handles[key] = self._after(delay_ms, _invoke)
+            self._debounce_handles.move_to_end(key)
+            if len(self._debounce_handles) > _MAX_TIMER_HANDLES:
+                _, stale = self._debounce_handles.popitem(last=False)
+                try:
+                    self._after_cancel(stale)
+                except Exception:
+                    pass
         except Exception:
             _invoke()
 
+    def _cancel_all_after(self, event: Optional[tk.Event] = None) -> None:
+        """Cancel every pending after-callback when the window is destroyed.
+
+        Bound to <Destroy> so no debounce, animation, pump, or countdown
+        timer lingers against a dead Tcl interpreter.
+        """
+        if event is not None and getattr(event, "widget", None) is not self.window:
+            return
+        handles = list(self._debounce_handles.values()) + list(self._animation_handles.values())
+        self._debounce_handles.clear()
+        self._animation_handles.clear()
+        if self._ui_event_after is not None:
+            handles.append(self._ui_event_after)
+            self._ui_event_after = None
+        if self._countdown_after is not None:
+            handles.append(self._countdown_after)
+            self._countdown_after = None
+        if self._offset_idle_id is not None:
+            handles.append(self._offset_idle_id)
+            self._offset_idle_id = None
+        if self._status_after is not None:
+            handles.append(self._status_after)
+            self._status_after = None
+        for handle in handles:
+            try:
+                self._after_cancel(handle)
+            except Exception:
+                pass
+
     def post_ui_event(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        # Same-thread calls (button handlers, settings load) run directly;
+        # the queue + virtual-event wakeup is only for marshalling calls in
+        # from backend threads.
+        if threading.get_ident() == self._ui_thread_id:
+            func(*args, **kwargs)
+            return
+
         def _callback() -> None:
             func(*args, **kwargs)
 
-        self._ui_event_queue.put(_callback)
+        with self._ui_event_lock:
+            self._ui_event_queue.append(_callback)
+        try:
+            # event_generate is documented thread-safe: it wakes the Tk event
+            # loop only when there is actually work, instead of polling.
+            self.window.event_generate("<<UIEvent>>", when="tail")
+        except Exception:
+            # The slow safety drain will pick the callback up.
+            pass
+
+    def _drain_ui_events(self) -> None:
+        if not self._ui_event_queue:
+            return
+        # Swap the whole deque out under the lock, then run the batch
+        # unlocked; no per-item locking and no exception-on-empty exit.
+        with self._ui_event_lock:
+            batch = self._ui_event_queue
+            self._ui_event_queue = collections.deque()
+        for callback in batch:
+            try:
+                callback()
+            except Exception:
+                pass
 
     def _start_ui_event_pump(self) -> None:
         if self._ui_event_after is not None:
             return
 
+        # Event-driven wakeup: producers post a virtual event per enqueue.
+        try:
+            self.window.bind("<<UIEvent>>", lambda _event: self._drain_ui_events())
+        except Exception:
+            pass
+
+        # Slow 1 Hz safety drain in case an event_generate call failed
+        # (e.g. during teardown races).
         def _drain_queue() -> None:
-            while True:
-                try:
-                    callback = self._ui_event_queue.get_nowait()
-                except queue.Empty:
-                    break
-                try:
-                    callback()
-                except Exception:
-                    pass
+            self._drain_ui_events()
             try:
-                self._ui_event_after = self.window.after(30, _drain_queue)
+                self._ui_event_after = self._after(1000, _drain_queue)
             except Exception:
                 self._ui_event_after = None
 
         try:
-            self._ui_event_after = self.window.after(30, _drain_queue)
+            self._ui_event_after = self._after(1000, _drain_queue)
         except Exception:
             _drain_queue()
 
@@ -668,7 +1116,7 @@ class GUIWindow:
         if self._ui_event_after is None:
             return
         try:
-            self.window.after_cancel(self._ui_event_after)
+            self._after_cancel(self._ui_event_after)
         except Exception:
             pass
         finally:
@@ -691,14 +1139,23 @@ class GUIWindow:
             return
 
         def _tick() -> None:
-            self._update_countdown_label()
+            # Skip label work entirely while minimized to the indicator;
+            # nothing is visible, so redrawing only wakes the event loop.
+            try:
+                withdrawn = self.window.state() == "withdrawn"
+            except Exception:
+                withdrawn = False
+            if not withdrawn:
+                self._update_countdown_label()
+            # Back off to 500 ms when there is no countdown to animate.
+            idle = not self._is_running and self._countdown_target_ts is None
             try:
-                self._countdown_after = self.window.after(100, _tick)
+                self._countdown_after = self._after(500 if idle or withdrawn else 100, _tick)
             except Exception:
                 self._countdown_after = None
 
         try:
-            self._countdown_after = self.window.after(100, _tick)
+            self._countdown_after = self._after(100, _tick)
         except Exception:
             _tick()
 
@@ -706,7 +1163,7 @@ class GUIWindow:
         if self._countdown_after is None:
             return
         try:
-            self.window.after_cancel(self._countdown_after)
+            self._after_cancel(self._countdown_after)
         except Exception:
             pass
         finally:
@@ -714,14 +1171,28 @@ class GUIWindow:
         self._countdown_target_ts = None
         self._countdown_total_interval = None
 
+    def _set_text_if_changed(self, key: str, configure: Callable[..., Any], text: str) -> bool:
+        """Write ``text`` via ``configure`` only if it differs from the last write.
+
+        Countdown ticks frequently re-render the same rounded string; the
+        string compare here is far cheaper than a Tcl configure round-trip.
+        Callers pass the widget's pre-bound configure method.
+        """
+        if self._last_label_texts.get(key) == text:
+            return False
+        self._last_label_texts[key] = text
+        configure(text=text)
+        return True
+
     def _update_countdown_label(self) -> None:
         if self.countdown_value_label is None:
             return
         if not self._is_running or self._countdown_target_ts is None:
-            self.countdown_value_label.configure(text="--.- s")
+            self._set_text_if_changed("countdown", self._countdown_configure, "--.- s")
             return
         remaining = max(0.0, self._countdown_target_ts - time.monotonic())
-        self.countdown_value_label.configure(text=f"{remaining:0.1f} s")
+        idx = min(999, int(remaining * 10 + 0.5))
+        self._set_text_if_changed("countdown", self._countdown_configure, _COUNTDOWN_STRS[idx])
         total = getattr(self, "_countdown_total_interval", None)
         if total is None or total <= 0:
             return
@@ -731,20 +1202,29 @@ class GUIWindow:
             if key in self._validation_messages:
                 self._validation_messages.pop(key)
             self._validation_messages[key] = message
+            self._latest_validation_key = key
         else:
             self._validation_messages.pop(key, None)
+            if self._latest_validation_key == key:
+                self._latest_validation_key = next(reversed(self._validation_messages), None)
         self._refresh_validation_banner()
 
     def _clear_validation_message(self, key: str) -> None:
         if key in self._validation_messages:
             self._validation_messages.pop(key, None)
+            if self._latest_validation_key == key:
+                self._latest_validation_key = next(reversed(self._validation_messages), None)
             self._refresh_validation_banner()
 
     def _refresh_validation_banner(self) -> None:
         if not self._validation_messages:
             self._hide_validation_banner()
             return
-        latest_message = next(reversed(self._validation_messages.values()))
+        # The most recent key is tracked explicitly so the common refresh
+        # doesn't build a reversed iterator over the dict.
+        latest_message = self._validation_messages.get(self._latest_validation_key)
+        if latest_message is None:
+            latest_message = next(reversed(self._validation_messages.values()))
         self._show_validation_banner(latest_message)
 
     def _show_validation_banner(self, message: str) -> None:
@@ -752,19 +1232,13 @@ class GUIWindow:
             return
         self.validation_banner_label.configure(text=message)
         if not self._validation_banner_visible:
-            try:
-                self.validation_banner_frame.pack(fill="x", pady=(0, SPACE_12))
-            except Exception:
-                pass
+            self.validation_banner_frame.pack(fill="x", pady=(0, SPACE_12))
             self._validation_banner_visible = True
 
     def _hide_validation_banner(self) -> None:
         if not self.validation_banner_frame or not self._validation_banner_visible:
             return
-        try:
-            self.validation_banner_frame.pack_forget()
-        except Exception:
-            pass
+        self.validation_banner_frame.pack_forget()
         self._validation_banner_visible = False
 
     def animate_color(
@@ -774,12 +1248,18 @@ class GUIWindow:
         to_hex: str,
         duration_ms: int,
         setter: Callable[[str], None],
-        steps: int = 10,
+        steps: int = 6,
     ) -> None:
+        # Repeat requests toward the target this key is already at (or
+        # animating to) are dropped before any parsing or cancellation.
+        if self._animation_targets.get(key) == to_hex:
+            return
+        self._animation_targets[key] = to_hex
+
         handle = self._animation_handles.pop(key, None)
         if handle is not None:
             try:
-                self.window.after_cancel(handle)
+                self._after_cancel(handle)
             except Exception:
                 pass
         from_hex = self._coerce_color_hex(from_hex, to_hex)
@@ -788,64 +1268,118 @@ class GUIWindow:
             setter(to_hex)
             return
         steps = max(2, steps)
-        interval = max(16, duration_ms // steps) if duration_ms > 0 else 0
-        step_state = {"index": 0}
+        if duration_ms <= 0:
+            setter(to_hex)
+            return
+        target_ms = duration_ms / steps
+
+        # The endpoints and step count are fixed for the whole animation, so
+        # every frame color is computed up front; each tick is then a list
+        # index instead of parse + blend + format work on the Tk thread.
+        last = steps - 1
+        if steps >= 16:
+            # Long fades: one batched pass that parses the endpoints once.
+            frames = _precompute_hex_frames(from_hex, to_hex, steps)
+        else:
+            frames = [hex_lerp(from_hex, to_hex, i / last) for i in range(steps)]
+        index = 0
+        perf_counter = time.perf_counter
+        # Closure locals for everything the tick touches; the callback body
+        # runs on LOAD_FAST/LOAD_DEREF with no attribute lookups.
+        after = self._after
+        handles = self._animation_handles
+
+        def _next_delay() -> int:
+            # Subtract the smoothed tick cost from the frame budget so slow
+            # redraws don't make callbacks pile up in the event queue, and
+            # clamp to keep the schedule sane in both directions.
+            delay = int(target_ms - self._anim_cost_ema * 1000.0)
+            return 4 if delay < 4 else 64 if delay > 64 else delay
 
         def _tick() -> None:
-            idx = step_state["index"]
-            t = min(1.0, idx / (steps - 1))
-            setter(hex_lerp(from_hex, to_hex, t))
-            if t >= 1.0:
-                self._animation_handles.pop(key, None)
+            nonlocal index
+            start = perf_counter()
+            idx = index
+            setter(frames[idx])
+            if idx >= last:
+                handles.pop(key, None)
                 return
-            step_state["index"] = idx + 1
-            self._animation_handles[key] = self.window.after(interval, _tick)
-
-        if interval == 0:
-            setter(to_hex)
-            return
-        step_state["index"] = 0
-        self._animation_handles[key] = self.window.after(interval, _tick)
+            index = idx + 1
+            cost = perf_counter() - start
+            self._anim_cost_ema += 0.2 * (cost - self._anim_cost_ema)
+            handles[key] = after(_next_delay(), _tick)
+
+        handles[key] = after(_next_delay(), _tick)
+        self._animation_handles.move_to_end(key)
+        if len(self._animation_handles) > _MAX_TIMER_HANDLES:
+            _, stale = self._animation_handles.popitem(last=False)
+            try:
+                self._after_cancel(stale)
+            except Exception:
+                pass
 
     def _coerce_color_hex(self, value: Any, fallback: str) -> str:
-        if isinstance(value, str) and value.startswith("#") and len(value) in {4, 7}:
-            if len(value) == 4:
-                r, g, b = value[1], value[2], value[3]
-                return f"#{r}{r}{g}{g}{b}{b}".upper()
-            return value.upper()
+        if isinstance(value, str) and isinstance(fallback, str):
+            return _coerce_color_hex_cached(value, fallback)
         return fallback.upper() if isinstance(fallback, str) else "#000000"
 
+    def _set_offset(self, value: int, source: str) -> None:
+        """Single write path for the offset controls.
+
+        Clamps once, then writes only the controls that don't already show
+        ``value``; ``source`` names the originating control so it is never
+        written back. The equality guards cut the var<->scale feedback loop
+        on their own, so no re-entrancy flag is involved. Backend
+        application is debounced and deduplicated separately.
+        """
+        value = max(0, min(OFFSET_MAX_PX, value))
+        if value == self._last_offset:
+            return
+        self._last_offset = value
+
+        # The mirrors track each control's last-known value, so deciding
+        # whether to write is a Python compare rather than a Tcl read-back.
+        if source != "var" and self._offset_var_value != value:
+            self._offset_var_value = value
+            try:
+                self.offset_range_var.set(value)
+            except Exception:
+                pass
+        if source != "scale" and self._offset_scale is not None and self._offset_scale_value != value:
+            self._offset_scale_value = value
+            try:
+                self._offset_scale.set(float(value))
+            except Exception:
+                pass
+
+        self._update_offset_display(value)
+        # Coalesce backend application across a drag: dozens of writes per
+        # second collapse into one update shortly after the last one.
+        self.debounce("offset_apply", 80, self._apply_offset_settings, value)
+
+    def _offset_key_valid(self, proposed: str) -> bool:
+        # Empty is allowed mid-edit; anything else must be an in-range int.
+        if proposed == "":
+            return True
+        try:
+            return 0 <= int(proposed) <= OFFSET_MAX_PX
+        except ValueError:
+            return False
+
     def _on_offset_var_changed(self) -> None:
-        if self._in_offset_update:
+        if self._loading:
             return
         try:
             value = int(self.offset_range_var.get())
         except Exception:
+            self._offset_var_value = None
             self._set_validation_message("offset", f"Offset must be a number between 0 and {OFFSET_MAX_PX} px.")
             return
-        value = max(0, min(OFFSET_MAX_PX, value))
+        self._offset_var_value = value
         self._clear_validation_message("offset")
-        if value != self.offset_range_var.get():
-            self._in_offset_update = True
-            try:
-                self.offset_range_var.set(value)
-            finally:
-                self._in_offset_update = False
-            return
-
-        self._update_offset_display(value)
-        if self._offset_scale is not None:
-            self._in_offset_update = True
-            try:
-                self._offset_scale.set(float(value))
-            finally:
-                self._in_offset_update = False
-
-        self._apply_offset_settings(value)
+        self._set_offset(value, "var")
 
     def _on_offset_scale_changed(self, value: str) -> None:
-        if self._in_offset_update:
-            return
         try:
             numeric = int(float(value))
         except (TypeError, ValueError):
@@ -853,24 +1387,35 @@ class GUIWindow:
             return
         self._clear_validation_message("offset")
         numeric = max(0, min(OFFSET_MAX_PX, numeric))
-        if numeric != self.offset_range_var.get():
-            self._in_offset_update = True
+        self._offset_scale_value = numeric
+        # Scale drags arrive at the Tk event rate; park the newest value and
+        # flush once per idle cycle so intermediate positions are skipped.
+        self._offset_pending = numeric
+        if self._offset_idle_id is None:
             try:
-                self.offset_range_var.set(numeric)
-            finally:
-                self._in_offset_update = False
-        else:
-            self._update_offset_display(numeric)
-            self._apply_offset_settings(numeric)
+                self._offset_idle_id = self.window.after_idle(self._flush_offset)
+            except Exception:
+                self._offset_idle_id = None
+                self._flush_offset()
+
+    def _flush_offset(self) -> None:
+        self._offset_idle_id = None
+        numeric = self._offset_pending
+        self._offset_pending = None
+        if numeric is not None:
+            self._set_offset(numeric, "scale")
 
     def _update_offset_display(self, value: int) -> None:
-        if self._offset_display_label is not None:
-            try:
-                ratio = min(1.0, max(0.0, float(value) / float(OFFSET_MAX_PX)))
-                color = hex_lerp(self.theme.strong_text, self.theme.highlight, ratio)
-                self._offset_display_label.configure(text=f"±{value} px", foreground=color)
-            except Exception:
-                pass
+        # Reflected updates frequently echo the value already on screen;
+        # skip the color lerp and configure when nothing changed.
+        if value == self._last_offset_displayed:
+            return
+        self._last_offset_displayed = value
+        if self._offset_display_label is None or self._destroyed:
+            return
+        ratio = min(1.0, max(0.0, float(value) / float(OFFSET_MAX_PX)))
+        color = hex_lerp_packed(self.theme.strong_text_rgb, self.theme.highlight_rgb, ratio)
+        self._offset_display_configure(text=f"±{value} px", foreground=color)
 
     def reflect_offset_range(self, value: int) -> None:
         self.post_ui_event(self._apply_reflected_offset_range, value)
@@ -880,17 +1425,11 @@ class GUIWindow:
             numeric = int(value)
         except Exception:
             return
+        # The backend already holds this value; pre-mark it applied so the
+        # debounced apply path no-ops instead of echoing it back.
         numeric = max(0, min(OFFSET_MAX_PX, numeric))
-        self._in_offset_update = True
-        try:
-            self.offset_range_var.set(numeric)
-            if self._offset_scale is not None:
-                self._offset_scale.set(float(numeric))
-        except Exception:
-            pass
-        finally:
-            self._in_offset_update = False
-        self._update_offset_display(numeric)
+        self._last_applied_offset = numeric
+        self._set_offset(numeric, "remote")
 
     def _status_message_text(self, is_active: bool, locked_position: Optional[Tuple[int, int]]) -> str:
         if is_active and locked_position is not None:
@@ -902,47 +1441,101 @@ class GUIWindow:
     def _update_status_pill(self, is_active: bool) -> None:
         if self.status_pill_label is None:
             return
-        state = "running" if is_active else "idle"
-        target_bg, target_fg = self._status_pill_colors[state]
-        current_bg = self._coerce_color_hex(self.status_pill_label.cget("background"), target_bg)
-        self.status_pill_label.configure(text="Running" if is_active else "Idle", fg=target_fg)
-        if current_bg.lower() == target_bg.lower():
-            self.status_pill_label.configure(bg=target_bg)
+        target_bg, target_fg = self._status_pill_running if is_active else self._status_pill_idle
+        # The last written background is tracked here instead of read back
+        # via cget, saving a Tcl round-trip per status toggle.
+        current_bg = self._last_status_pill_bg or target_bg
+        pill_configure = self._pill_configure
+        pill_configure(text="Running" if is_active else "Idle", fg=target_fg)
+        if current_bg == target_bg:
+            pill_configure(bg=target_bg)
+            self._last_status_pill_bg = target_bg
             return
-        self.animate_color(
-            "status_pill",
-            current_bg,
-            target_bg,
-            240,
-            lambda color: self.status_pill_label.configure(bg=color),
-        )
+
+        def _set_bg(color: str) -> None:
+            pill_configure(bg=color)
+            self._last_status_pill_bg = color
+
+        self.animate_color("status_pill", current_bg, target_bg, 240, _set_bg)
 
     # Public API
     def update_status(self, is_active: bool, locked_position: Optional[Tuple[int, int]]) -> None:
-        self.post_ui_event(self._apply_status_update, is_active, locked_position)
+        # Newest args win; the gate below collapses bursts to at most one
+        # applied redraw per interval, so a chatty backend can't starve the
+        # event loop with status traffic.
+        self._next_status_args = (is_active, locked_position)
+        self.post_ui_event(self._status_gate)
+
+    _STATUS_MIN_INTERVAL = 0.05  # seconds; ~20 Hz redraw ceiling
+
+    def _status_gate(self) -> None:
+        if self._status_after is not None:
+            # A trailing flush is already scheduled; it reads the newest args.
+            return
+        elapsed = time.monotonic() - self._last_status_tick
+        if elapsed >= self._STATUS_MIN_INTERVAL:
+            self._flush_status()
+            return
+        delay_ms = max(1, int((self._STATUS_MIN_INTERVAL - elapsed) * 1000))
+        try:
+            self._status_after = self._after(delay_ms, self._flush_status)
+        except Exception:
+            self._flush_status()
+
+    def _flush_status(self) -> None:
+        self._status_after = None
+        self._last_status_tick = time.monotonic()
+        args = self._next_status_args
+        if args is not None:
+            self._apply_status_update(*args)
 
     def _apply_status_update(self, is_active: bool, locked_position: Optional[Tuple[int, int]]) -> None:
+        if self._destroyed:
+            return
+        # Repeated pushes of an identical state (toggle echoes, periodic
+        # refreshes) should not touch any widget.
+        state = (is_active, locked_position)
+        if state == self._last_status_state:
+            return
+        self._last_status_state = state
+
         if self.status_value_label is not None:
             style = "StatusActive.TLabel" if is_active else "StatusInactive.TLabel"
-            self.status_value_label.configure(text="Active" if is_active else "Inactive", style=style)
+            # Style changes in lockstep with the text, so the text cache
+            # covers both.
+            if self._set_text_if_changed(
+                "status_value", self._status_value_configure, "Active" if is_active else "Inactive"
+            ):
+                self._status_value_configure(style=style)
         if self.start_stop_button is not None:
-            if is_active:
-                self.start_stop_button.configure(text="Stop Auto-Clicker", style="Danger.TButton")
-            else:
-                self.start_stop_button.configure(text="Start Auto-Clicker", style="Primary.TButton")
+            style = "Danger.TButton" if is_active else "Primary.TButton"
+            if style != self._last_button_style:
+                self._last_button_style = style
+                self._start_stop_configure(
+                    text="Stop Auto-Clicker" if is_active else "Start Auto-Clicker",
+                    style=style,
+                )
         if self.position_label is not None:
             if locked_position is not None:
-                self.position_label.configure(text=f"Position: {locked_position[0]}, {locked_position[1]}")
+                text = f"Position: {locked_position[0]}, {locked_position[1]}"
             else:
-                self.position_label.configure(text="Position: Not Locked")
+                text = "Position: Not Locked"
+            self._set_text_if_changed("position", self._position_configure, text)
         if self.status_message_label is not None:
-            self.status_message_label.configure(text=self._status_message_text(is_active, locked_position))
+            self._set_text_if_changed(
+                "status_message",
+                self._status_message_configure,
+                self._status_message_text(is_active, locked_position),
+            )
         self._update_status_pill(is_active)
         self._is_running = is_active
         if not is_active:
             self._countdown_target_ts = None
             self._countdown_total_interval = None
         self._update_countdown_label()
+        # One redraw pass for the whole batch instead of a damage event per
+        # configure above.
+        self.window.update_idletasks()
 
     def minimize_to_indicator(self) -> None:
         try:
@@ -955,6 +1548,9 @@ class GUIWindow:
             self.window.deiconify()
             self.window.lift()
             self.window.focus_force()
+            # Flush the reappearing window's relayout in one idle pass
+            # rather than leaving it to trickle through later events.
+            self.window.update_idletasks()
         except Exception:
             pass
 
@@ -963,37 +1559,28 @@ class GUIWindow:
         Handle window close button click.
         This is called when user clicks the X button on the window.
         """
+        self._destroyed = True
         self._stop_ui_event_pump()
         self._stop_countdown_loop()
+        # Flush any pending settings write before teardown.
         try:
-            # Add diagnostic log
-            import src.config as cfg
-            if cfg.CONSOLE_OUTPUT_ENABLED:
-                print("[DEBUG] GUI _on_close_window called - user clicked close button")
+            self._save_executor.shutdown(wait=True)
         except Exception:
             pass
+        self._debug("[DEBUG] GUI _on_close_window called - user clicked close button")
 
         try:
             # Call the app's close handler which triggers full cleanup
             if hasattr(self.app, '_on_close_window'):
-                if hasattr(self.app, 'config'):
-                    if self.app.config.CONSOLE_OUTPUT_ENABLED:
-                        print("[DEBUG] Calling app._on_close_window()")
+                self._debug("[DEBUG] Calling app._on_close_window()")
                 self.app._on_close_window()
             else:
                 # Fallback: call cleanup directly
                 if hasattr(self.app, 'cleanup'):
-                    if hasattr(self.app, 'config'):
-                        if self.app.config.CONSOLE_OUTPUT_ENABLED:
-                            print("[DEBUG] Calling app.cleanup() as fallback")
+                    self._debug("[DEBUG] Calling app.cleanup() as fallback")
                     self.app.cleanup()
         except Exception as e:
-            try:
-                import src.config as cfg
-                if cfg.CONSOLE_OUTPUT_ENABLED:
-                    print(f"[DEBUG] Error in _on_close_window: {e}")
-            except Exception:
-                pass
+            self._debug(f"[DEBUG] Error in _on_close_window: {e}")
 
     # Event handlers
     def _on_toggle_clicked(self) -> None:
@@ -1003,67 +1590,73 @@ class GUIWindow:
             pass
 
     def _apply_delay_settings(self) -> None:
-        try:
-            valid, msg = self._timing_is_valid()
-            if not valid:
-                self._set_timing_error(msg)
-                return
-            min_d = self._clamp_delay_value(self.min_delay_var.get())
-            max_d = self._clamp_delay_value(self.max_delay_var.get())
-            self.min_delay_var.set(min_d)
-            self.max_delay_var.set(max_d)
-            if hasattr(self.app, "update_delay_range"):
-                self.app.update_delay_range(float(min_d), float(max_d))
-            self._update_applied_delay_label(min_d, max_d)
-            self._set_timing_error("")
-        except Exception:
-            pass
+        valid, msg, min_d, max_d = self._timing_is_valid()
+        if not valid:
+            self._set_timing_error(msg)
+            return
+        # Validation already parsed the vars; clamp the returned floats
+        # without re-reading (or exception-guarding) anything.
+        min_d = self._clamp_delay_value_fast(min_d)
+        max_d = self._clamp_delay_value_fast(max_d)
+        self.min_delay_var.set(min_d)
+        self.max_delay_var.set(max_d)
+        if hasattr(self.app, "update_delay_range"):
+            self.app.update_delay_range(float(min_d), float(max_d))
+        self._update_applied_delay_label(min_d, max_d)
+        self._set_timing_error("")
 
     def _validate_timing_inputs(self) -> None:
-        valid, msg = self._timing_is_valid()
+        valid, msg, min_d, max_d = self._timing_is_valid()
+        # Skip the downstream widget updates when the values haven't changed
+        # since the last successful pass (focus traces, programmatic echoes);
+        # the floats come from the validation call, not a second var read.
+        current: Optional[Tuple[float, float]] = (min_d, max_d)
+        if valid and current == self._last_validated_timing and self._timing_inputs_valid:
+            return
+
+        self._last_validated_timing = current if valid else None
         self._timing_inputs_valid = valid
         self._set_timing_error(msg if not valid else "")
         if valid:
             self._clear_validation_message("timing")
         else:
             self._set_validation_message("timing", msg)
-        if self.apply_timing_button is not None:
-            try:
-                if valid:
-                    self.apply_timing_button.state(["!disabled"])
-                else:
-                    self.apply_timing_button.state(["disabled"])
-            except Exception:
-                pass
+        if self.apply_timing_button is not None and not self._destroyed:
+            self.apply_timing_button.state(["!disabled"] if valid else ["disabled"])
+
+    def _timing_is_valid(self) -> tuple[bool, str, float, float]:
+        """Validate the delay vars, returning the parsed floats alongside.
 
-    def _timing_is_valid(self) -> tuple[bool, str]:
+        Each Var.get() is a Tcl round-trip, so callers consume the values
+        from the return tuple instead of re-reading the vars.
+        """
         try:
             min_d = float(self.min_delay_var.get())
             max_d = float(self.max_delay_var.get())
         except Exception:
-            return False, f"Enter numeric delays ({MIN_DELAY_SECONDS:.1f}-{MAX_DELAY_SECONDS:.1f}s)."
+            return False, f"Enter numeric delays ({MIN_DELAY_SECONDS:.1f}-{MAX_DELAY_SECONDS:.1f}s).", 0.0, 0.0
         if min_d < MIN_DELAY_SECONDS or min_d > MAX_DELAY_SECONDS:
-            return False, f"Min delay must be between {MIN_DELAY_SECONDS:.1f}s and {MAX_DELAY_SECONDS:.1f}s."
+            return False, f"Min delay must be between {MIN_DELAY_SECONDS:.1f}s and {MAX_DELAY_SECONDS:.1f}s.", min_d, max_d
         if max_d < MIN_DELAY_SECONDS or max_d > MAX_DELAY_SECONDS:
-            return False, f"Max delay must be between {MIN_DELAY_SECONDS:.1f}s and {MAX_DELAY_SECONDS:.1f}s."
+            return False, f"Max delay must be between {MIN_DELAY_SECONDS:.1f}s and {MAX_DELAY_SECONDS:.1f}s.", min_d, max_d
         if max_d < min_d:
-            return False, "Max delay must be greater than or equal to Min delay."
-        return True, ""
+            return False, "Max delay must be greater than or equal to Min delay.", min_d, max_d
+        return True, "", min_d, max_d
 
     def _set_timing_error(self, message: str) -> None:
-        try:
-            if self.timing_error_label is not None:
-                self.timing_error_label.configure(text=message)
-        except Exception:
-            pass
+        if self.timing_error_label is not None and not self._destroyed:
+            self.timing_error_label.configure(text=message)
+
+    def _clamp_delay_value_fast(self, numeric: float) -> float:
+        """Clamp an already-numeric delay; no exception guard on this path."""
+        return max(MIN_DELAY_SECONDS, min(MAX_DELAY_SECONDS, round(numeric, 1)))
 
     def _clamp_delay_value(self, value: Any) -> float:
         try:
             numeric = float(value)
         except Exception:
             numeric = MIN_DELAY_SECONDS
-        numeric = max(MIN_DELAY_SECONDS, min(MAX_DELAY_SECONDS, round(numeric, 1)))
-        return numeric
+        return self._clamp_delay_value_fast(numeric)
 
     def _format_delay_text(self, value: float) -> str:
         if float(value).is_integer():
@@ -1071,13 +1664,15 @@ class GUIWindow:
         return f"{value:.1f}s"
 
     def _update_applied_delay_label(self, min_d: float, max_d: float) -> None:
-        try:
-            if self.applied_delay_label is not None:
-                min_text = self._format_delay_text(min_d)
-                max_text = self._format_delay_text(max_d)
-                self.applied_delay_label.configure(text=f"Applied: Min {min_text}, Max {max_text}")
-        except Exception:
-            pass
+        if self.applied_delay_label is None or self._destroyed:
+            return
+        min_text = self._format_delay_text(min_d)
+        max_text = self._format_delay_text(max_d)
+        self._set_text_if_changed(
+            "applied_delay",
+            self._applied_delay_configure,
+            f"Applied: Min {min_text}, Max {max_text}",
+        )
 
     def _apply_offset_settings(self, value: Optional[int] = None) -> None:
         try:
@@ -1085,70 +1680,96 @@ class GUIWindow:
         except Exception:
             return
         rng = max(0, min(OFFSET_MAX_PX, rng))
-        if value is None and rng != self.offset_range_var.get():
-            self._in_offset_update = True
-            try:
-                self.offset_range_var.set(rng)
-            finally:
-                self._in_offset_update = False
+        if rng == self._last_applied_offset:
             return
+        self._last_applied_offset = rng
         if hasattr(self.app, "update_offset_range"):
             self.app.update_offset_range(rng)
         self._update_offset_display(rng)
 
     def _apply_always_on_top(self) -> None:
-        try:
-            self.window.attributes('-topmost', bool(self.always_on_top_var.get()))
-        except Exception:
-            pass
+        if self._destroyed:
+            return
+        # The window-manager attribute call is an RPC; skip it when the
+        # value already applied matches (init, load, and toggle paths can
+        # all hit this with the same state).
+        value = bool(self.always_on_top_var.get())
+        if value == self._applied_topmost:
+            return
+        self._applied_topmost = value
+        self.window.attributes('-topmost', value)
 
     def _apply_show_indicator(self) -> None:
+        # Resolve the indicator root once; both branches need the same check.
+        root = getattr(getattr(self.app, "status_indicator", None), "root", None)
+        if root is None:
+            return
+        value = bool(self.show_indicator_var.get())
+        if value == self._applied_show_indicator:
+            return
+        self._applied_show_indicator = value
         try:
-            if self.show_indicator_var.get():
-                if getattr(self.app.status_indicator, "root", None) is not None:
-                    self.app.status_indicator.root.deiconify()
+            if value:
+                root.deiconify()
             else:
-                if getattr(self.app.status_indicator, "root", None) is not None:
-                    self.app.status_indicator.root.withdraw()
+                root.withdraw()
         except Exception:
             pass
 
+    def _refresh_debug_printer(self) -> None:
+        cfg = self._cfg
+        if cfg is not None and getattr(cfg, "CONSOLE_OUTPUT_ENABLED", False):
+            self._debug: Callable[..., None] = print
+        else:
+            self._debug = lambda *args, **kwargs: None
+
     def _apply_console_output(self) -> None:
-        try:
-            # Reflect in config value if present
-            import src.config as cfg  # type: ignore
-            cfg.CONSOLE_OUTPUT_ENABLED = bool(self.console_output_var.get())
-        except Exception:
+        # Reflect in config value if present
+        if self._cfg is not None:
             try:
-                import config as cfg  # type: ignore
-                cfg.CONSOLE_OUTPUT_ENABLED = bool(self.console_output_var.get())
+                self._cfg.CONSOLE_OUTPUT_ENABLED = bool(self.console_output_var.get())
             except Exception:
                 pass
+        self._refresh_debug_printer()
 
     # Settings persistence
+    def _load_settings_async(self) -> None:
+        """Read and parse the settings file (worker thread), then marshal
+        the result back to the Tk thread for application."""
+        data = _read_settings_file()
+        self.post_ui_event(self._apply_loaded_settings, data)
+
     def load_settings(self) -> None:
+        """Synchronous load for direct callers; __init__ uses the async path."""
+        self._apply_loaded_settings(_read_settings_file())
+
+    def _apply_loaded_settings(self, data: Optional[dict]) -> None:
+        # Suppress traces while the vars are bulk-assigned; one consolidated
+        # refresh below replaces the per-set validation/backend churn.
+        self._loading = True
         try:
-            if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                # Clamp persisted values into supported ranges
-                self.min_delay_var.set(self._clamp_delay_value(data.get("min_delay", self.min_delay_var.get())))
-                self.max_delay_var.set(self._clamp_delay_value(data.get("max_delay", self.max_delay_var.get())))
-                self.offset_range_var.set(int(data.get("offset_range", self.offset_range_var.get())))
-                self.always_on_top_var.set(bool(data.get("always_on_top", self.always_on_top_var.get())))
-                self.console_output_var.set(bool(data.get("console_output", self.console_output_var.get())))
-                self.show_indicator_var.set(bool(data.get("show_indicator", self.show_indicator_var.get())))
+            if data is not None:
+                # Write only the keys the file actually supplies; an absent
+                # key keeps the var's default without the Var.get round-trip
+                # the old inline-default form paid even on present keys.
+                # Persisted values are clamped into supported ranges.
+                if "min_delay" in data:
+                    self.min_delay_var.set(self._clamp_delay_value(data["min_delay"]))
+                if "max_delay" in data:
+                    self.max_delay_var.set(self._clamp_delay_value(data["max_delay"]))
+                if "offset_range" in data:
+                    self.offset_range_var.set(int(data["offset_range"]))
+                if "always_on_top" in data:
+                    self.always_on_top_var.set(bool(data["always_on_top"]))
+                if "console_output" in data:
+                    self.console_output_var.set(bool(data["console_output"]))
+                if "show_indicator" in data:
+                    self.show_indicator_var.set(bool(data["show_indicator"]))
                 # Hotkey deserialization with validation
                 hk = data.get("hotkey")
                 if isinstance(hk, dict):
-                    vk = hk.get("vk")
-                    char = hk.get("char")
-                    name = hk.get("name")
-                    self.hotkey_vk = int(vk) if isinstance(vk, int) else None
-                    self.hotkey_char = char if isinstance(char, str) and len(char) == 1 else None
-                    self.hotkey_name = name if isinstance(name, str) and name.startswith('Key.') else None
-                    self._update_hotkey_label()
-                else:
+                    self._set_hotkey(hk.get("vk"), hk.get("char"), hk.get("name"))
+                elif hk is not None:
                     # Fallback: string label only
                     try:
                         self.hotkey_var.set(str(hk))
@@ -1157,68 +1778,167 @@ class GUIWindow:
         except Exception:
             # Corrupt or unreadable settings should not crash
             pass
+        finally:
+            self._loading = False
+        self._validate_timing_inputs()
+        self._on_offset_var_changed()
+        # One backend flush for the fully-loaded state; nothing was applied
+        # piecemeal while the vars were being populated.
+        self._flush_all_settings()
+
+    def _settings_dict(self) -> dict:
+        return {
+            "min_delay": float(self._clamp_delay_value(self.min_delay_var.get())),
+            "max_delay": float(self._clamp_delay_value(self.max_delay_var.get())),
+            "offset_range": int(self.offset_range_var.get()),
+            "always_on_top": bool(self.always_on_top_var.get()),
+            "console_output": bool(self.console_output_var.get()),
+            "show_indicator": bool(self.show_indicator_var.get()),
+            # Persist hotkey with basic validation
+            "hotkey": self._serialize_hotkey(),
+        }
 
     def save_settings(self) -> None:
         try:
-            data = {
-                "min_delay": float(self._clamp_delay_value(self.min_delay_var.get())),
-                "max_delay": float(self._clamp_delay_value(self.max_delay_var.get())),
-                "offset_range": int(self.offset_range_var.get()),
-                "always_on_top": bool(self.always_on_top_var.get()),
-                "console_output": bool(self.console_output_var.get()),
-                "show_indicator": bool(self.show_indicator_var.get()),
-                # Persist hotkey with basic validation
-                "hotkey": self._serialize_hotkey(),
-            }
-            with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # Serialization is cheap and stays on the UI thread; only the
+            # disk write moves to the worker.
+            data = self._settings_dict()
+            if orjson is not None:
+                blob = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                blob = json.dumps(data, indent=2).encode("utf-8")
+
+            # Nothing changed since the last save: skip the disk write (and
+            # its fsync) entirely.
+            if blob == self._last_saved_blob:
+                return
+
+            with self._save_lock:
+                # Newest payload wins; bursty saves coalesce into one write.
+                self._pending_save = (blob, data)
+                if self._save_future is not None and not self._save_future.done():
+                    return
+                self._save_future = self._save_executor.submit(self._do_save)
         except Exception:
             pass
 
-    # Hotkey capture
-    def _capture_hotkey(self) -> None:
-        if Listener is None:
-            # Fallback: inform user capture is unavailable
+    def _do_save(self) -> None:
+        """Drain pending settings payloads to disk (worker thread)."""
+        while True:
+            with self._save_lock:
+                pending = self._pending_save
+                self._pending_save = None
+                if pending is None:
+                    self._save_future = None
+                    return
+            blob, data = pending
             try:
-                from tkinter import messagebox
-                messagebox.showinfo("Hotkey Capture", "pynput is unavailable; cannot capture.")
+                # Write-to-temp + atomic rename so a crash mid-save can
+                # never leave a torn settings file behind.
+                tmp_path = SETTINGS_FILE + ".tmp"
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, blob)
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, SETTINGS_FILE)
+                self._last_saved_blob = blob
+
+                # Refresh the cache with what was just written so the next
+                # load_settings skips the re-parse.
+                try:
+                    st = os.stat(SETTINGS_FILE)
+                    _SETTINGS_CACHE[SETTINGS_FILE] = (st.st_mtime_ns, st.st_size, data)
+                except OSError:
+                    pass
             except Exception:
                 pass
-            return
 
-        # Capture next key press in a short-lived listener
-        captured = {"done": False}
+    # Hotkey capture
+    def _capture_hotkey(self) -> None:
+        # The GUI has focus during capture, so a modal Toplevel with a
+        # native <KeyPress> binding does the job with no pynput listener
+        # thread and no polling: the key arrives on the next Tk event cycle.
+        try:
+            capture = tk.Toplevel(self.window)
+            capture.title("Capture Hotkey")
+            apply_window_bg(capture, self.theme)
+            ttk.Label(
+                capture,
+                text="Press the key to use as the toggle hotkey",
+                style="Body.TLabel",
+                padding=(SPACE_16, SPACE_12),
+            ).pack()
+            capture.transient(self.window)
+            capture.grab_set()
+            capture.focus_force()
+        except Exception:
+            return
 
-        def on_press(key):
-            if captured["done"]:
-                return False
+        def on_key(event: tk.Event) -> None:
             try:
-                # Interpret key: prefer vk if present
-                vk = getattr(key, 'vk', None)
-                char = getattr(key, 'char', None)
-                name = str(key) if vk is None and char is None else None
-                self.hotkey_vk = int(vk) if isinstance(vk, int) else None
-                self.hotkey_char = str(char) if isinstance(char, str) and len(char) == 1 else None
-                self.hotkey_name = name if isinstance(name, str) and name.startswith('Key.') else None
-                self._update_hotkey_label()
+                keycode = getattr(event, "keycode", None)
+                char = getattr(event, "char", None)
+                keysym = getattr(event, "keysym", None)
+                # Named (non-character) keys map onto the pynput-style
+                # 'Key.<name>' labels the settings format already uses.
+                has_char = isinstance(char, str) and len(char) == 1
+                if not has_char and isinstance(keysym, str) and keysym:
+                    name = f"Key.{keysym.lower()}"
+                else:
+                    name = None
+                self._set_hotkey(keycode, char, name)
                 self._apply_hotkey_to_handler()
-                captured["done"] = True
             finally:
-                # Stop listener after capture
-                return False
+                try:
+                    capture.grab_release()
+                    capture.destroy()
+                except Exception:
+                    pass
 
-        def run_listener():
+        try:
+            capture.bind("<KeyPress>", on_key)
+        except Exception:
             try:
-                with Listener(on_press=on_press) as l:
-                    l.join()
+                capture.destroy()
             except Exception:
                 pass
+            return
 
-        threading.Thread(target=run_listener, daemon=True).start()
+        # Watchdog: if no key arrives, tear the modal grab down after 10 s
+        # instead of holding input focus hostage indefinitely.
+        def _expire() -> None:
+            try:
+                if capture.winfo_exists():
+                    capture.grab_release()
+                    capture.destroy()
+            except Exception:
+                pass
+
+        try:
+            self._after(10_000, _expire)
+        except Exception:
+            pass
 
     # Hotkey helpers
+    def _set_hotkey(self, vk: Optional[int], char: Optional[str], name: Optional[str]) -> None:
+        """Validate and store a hotkey, refreshing the cached derived forms.
+
+        The label string and the serialized dict are rebuilt here, once per
+        actual hotkey change, instead of on every save_settings call.
+        """
+        self.hotkey_vk = int(vk) if isinstance(vk, int) else None
+        self.hotkey_char = char if isinstance(char, str) and len(char) == 1 else None
+        self.hotkey_name = name if isinstance(name, str) and name.startswith('Key.') else None
+        self._hotkey_serialized = {
+            "vk": self.hotkey_vk,
+            "char": self.hotkey_char,
+            "name": self.hotkey_name,
+        }
+        self._update_hotkey_label()
+
     def _update_hotkey_label(self) -> None:
-        label = ""
         if self.hotkey_vk is not None:
             label = f"vk={self.hotkey_vk}"
         elif self.hotkey_char is not None:
@@ -1240,8 +1960,4 @@ class GUIWindow:
             pass
 
     def _serialize_hotkey(self) -> dict:
-        return {
-            "vk": int(self.hotkey_vk) if isinstance(self.hotkey_vk, int) else None,
-            "char": self.hotkey_char if isinstance(self.hotkey_char, str) and len(self.hotkey_char) == 1 else None,
-            "name": self.hotkey_name if isinstance(self.hotkey_name, str) and self.hotkey_name.startswith('Key.') else None,
-        }
+        return self._hotkey_serialized
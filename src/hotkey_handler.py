@@ -6,14 +6,49 @@ It listens for the configured toggle hotkey (numpad 5) and triggers
 the application's toggle callback when pressed.
 """
 
+import threading
+import time
 from typing import Callable, Optional
 
 # Import pynput keyboard components
-from pynput.keyboard import Key, Listener, KeyCode
+from pynput.keyboard import Listener
 
 # Import configuration
 from .config import TOGGLE_HOTKEY, CONSOLE_OUTPUT_ENABLED
 
+# Native Windows backend (RegisterHotKey); no-op on other platforms
+from . import win32_hotkey
+
+# Debug logging bound once at import: a real printer when console output is
+# enabled, a no-op otherwise. Callers pass printf-style args so no message
+# string is built when logging is disabled.
+if CONSOLE_OUTPUT_ENABLED:
+    def _log(message: str, *args: object) -> None:
+        print(message % args if args else message)
+else:
+    def _log(message: str, *args: object) -> None:
+        pass
+
+# Sentinel distinguishing "key has no vk attribute" (pynput Key enum) from
+# "key has vk=None" (KeyCode on some platforms).
+_NO_VK = object()
+
+# Config-name -> Windows virtual-key table. Numpad digits are VK_NUMPAD0
+# (0x60) through VK_NUMPAD9 (0x69); the aliases cover the spellings the
+# config has used over time.
+_NAME_TO_VK: dict = {f"num_{i}": 0x60 + i for i in range(10)}
+_NAME_TO_VK.update({"numpad5": 0x65, "numpad_5": 0x65})
+
+# TOGGLE_HOTKEY resolved to a vk once at import: string names go through
+# the table, Key-enum-like values contribute their vk attribute, anything
+# unrecognized resolves to None. No per-instance (let alone per-press)
+# string parsing remains.
+_DEFAULT_VK: Optional[int] = (
+    _NAME_TO_VK.get(TOGGLE_HOTKEY.lower())
+    if isinstance(TOGGLE_HOTKEY, str)
+    else getattr(TOGGLE_HOTKEY, "vk", None)
+)
+
 
 class HotkeyHandler:
     """
@@ -30,6 +65,23 @@ class HotkeyHandler:
     TODO: Use TOGGLE_HOTKEY from config to determine which key to listen for
     """
 
+    # Fixed attribute set: slot descriptors give C-level attribute access
+    # on the per-keystroke _on_press path and drop the per-instance dict.
+    __slots__ = (
+        "toggle_callback",
+        "_subs",
+        "_subs_lock",
+        "_hotkey_vk",
+        "_hotkey_char",
+        "_hotkey_char_lower",
+        "_hotkey_name",
+        "_match",
+        "_last_fire",
+        "_min_interval",
+        "_native",
+        "_listener",
+    )
+
     def __init__(self, toggle_callback: Callable[[], None]) -> None:
         """
         Initialize the hotkey handler.
@@ -42,23 +94,47 @@ class HotkeyHandler:
 
         self.toggle_callback: Callable[[], None] = toggle_callback
 
+        # Hotkey subscribers as a copy-on-write tuple: mutations rebuild
+        # the tuple under a lock, while dispatch reads it lock-free — the
+        # rebind is a single GIL-atomic store, so a reader sees either the
+        # old tuple or the new one, never a partial list. Groundwork for
+        # the multiple-hotkey TODOs without putting a mutex on every press.
+        self._subs: tuple = (toggle_callback,)
+        self._subs_lock = threading.Lock()
+
         # Hotkey matching configuration (runtime adjustable)
         # Prefer virtual key code when available (Windows Numpad5 = 101)
         self._hotkey_vk: Optional[int] = None
         self._hotkey_char: Optional[str] = None
+        # Lowercased form precomputed by set_hotkey so _on_press compares
+        # without re-lowering the configured char per keystroke.
+        self._hotkey_char_lower: Optional[str] = None
         self._hotkey_name: Optional[str] = None
 
-        # Map default TOGGLE_HOTKEY to a sensible default
-        # Current default: 'num_5' => VK 101 on Windows
-        if isinstance(TOGGLE_HOTKEY, str) and TOGGLE_HOTKEY.lower() in {"num_5", "numpad5", "numpad_5"}:
-            self._hotkey_vk = 101
+        # Default hotkey: TOGGLE_HOTKEY as resolved at import time
+        # (current default: 'num_5' => VK 101 on Windows)
+        self._hotkey_vk = _DEFAULT_VK
 
-        # Initialize pynput keyboard listener, but do not start yet
-        # Use _on_press as the callback for key press events
-        self._listener: Optional[Listener] = Listener(on_press=self._on_press)
+        # Match predicate specialized to the configured fields; rebuilt by
+        # set_hotkey so _on_press just calls it.
+        self._match: Callable[[object], bool] = self._build_match()
 
-        # Ensure listener runs as a daemon when started to avoid blocking shutdown
-        self._listener.daemon = True
+        # Debounce window for the toggle: holding the hotkey generates OS
+        # key-repeat events, and each one would start/stop the scheduler.
+        self._last_fire: float = 0.0
+        self._min_interval: float = 0.15
+
+        # Native Windows listener (RegisterHotKey); preferred over the
+        # pynput low-level hook when the configured hotkey is a plain vk,
+        # because the kernel filters keystrokes and only WM_HOTKEY messages
+        # ever reach Python.
+        self._native: Optional[win32_hotkey.Win32HotkeyListener] = None
+
+        # pynput listener is constructed lazily in start(): Listener()
+        # allocates pynput's platform backend (on Windows, a low-level
+        # keyboard hook), which should not exist during the window between
+        # construction and start() while the rest of the app initializes.
+        self._listener: Optional[Listener] = None
 
     def start(self) -> None:
         """
@@ -66,23 +142,43 @@ class HotkeyHandler:
 
         The listener runs in the background and does not block the main thread.
         Safe to call multiple times; will only start if not already running.
+
+        On Windows with a plain-vk hotkey the native RegisterHotKey backend
+        is used; pynput is the fallback everywhere else (and when native
+        registration fails, e.g. the key is claimed by another app).
         """
+        vk = self._native_vk()
+        if vk is not None and win32_hotkey.is_supported():
+            if self._native is not None:
+                return
+            try:
+                native = win32_hotkey.Win32HotkeyListener(vk, self._on_native_hotkey)
+                if native.start():
+                    self._native = native
+                    _log("[DEBUG] Native RegisterHotKey listener started for vk=%s", vk)
+                    return
+                _log("[DEBUG] RegisterHotKey failed for vk=%s; falling back to pynput", vk)
+            except Exception as e:
+                _log("[DEBUG] Error starting native listener: %s", e)
+
         try:
             if self._listener is None:
-                # Recreate listener if it was previously cleaned up
-                self._listener = Listener(on_press=self._on_press)
-                self._listener.daemon = True
+                # Single construction site: first start and restarts after
+                # stop() both come through here.
+                self._listener = self._make_listener()
 
-            # Start only if not already running
-            if not getattr(self._listener, "running", False):
+            # Start only if not already running; _listener is a real
+            # Listener here, so read .running directly instead of a
+            # defensive getattr.
+            if not self._listener.running:
                 self._listener.start()
-                if CONSOLE_OUTPUT_ENABLED:
-                    print(f"[DEBUG] Hotkey listener started. Configured hotkey vk={self._hotkey_vk} char={self._hotkey_char} name={self._hotkey_name}")
+                _log(
+                    "[DEBUG] Hotkey listener started. Configured hotkey vk=%s char=%s name=%s",
+                    self._hotkey_vk, self._hotkey_char, self._hotkey_name,
+                )
         except Exception as e:
             # Prevent any startup errors from crashing the application
-            if CONSOLE_OUTPUT_ENABLED:
-                print(f"[DEBUG] Error starting listener: {e}")
-            pass
+            _log("[DEBUG] Error starting listener: %s", e)
 
     def stop(self) -> None:
         """
@@ -90,35 +186,33 @@ class HotkeyHandler:
 
         Ensures a clean shutdown of the listener thread.
         """
-        if CONSOLE_OUTPUT_ENABLED:
-            print("[DEBUG] HotkeyHandler.stop() called")
-        
+        _log("[DEBUG] HotkeyHandler.stop() called")
+
+        if self._native is not None:
+            try:
+                self._native.stop()
+            except Exception as e:
+                _log("[DEBUG] Exception during native listener stop: %s", e)
+            finally:
+                self._native = None
+
         if self._listener is not None:
             try:
-                if CONSOLE_OUTPUT_ENABLED:
-                    print("[DEBUG] Calling listener.stop()...")
                 self._listener.stop()
-                
-                if CONSOLE_OUTPUT_ENABLED:
-                    print("[DEBUG] Attempting to join listener thread with 0.5s timeout...")
-                # Attempt to join briefly for clean shutdown; ignore if unsupported
+                # Short bounded join: a healthy listener exits within a few
+                # milliseconds of stop(), and a wedged backend hook should
+                # not stall app shutdown — the thread is a daemon, so the
+                # process exits regardless.
                 try:
-                    self._listener.join(timeout=0.5)
-                    if CONSOLE_OUTPUT_ENABLED:
-                        print("[DEBUG] Listener thread joined successfully")
+                    self._listener.join(timeout=0.05)
+                    _log("[DEBUG] Listener thread joined successfully")
                 except Exception as e:
-                    if CONSOLE_OUTPUT_ENABLED:
-                        print(f"[DEBUG] Exception during listener.join(): {e}")
-                    pass
+                    _log("[DEBUG] Exception during listener.join(): %s", e)
             except Exception as e:
                 # Prevent shutdown errors from bubbling up
-                if CONSOLE_OUTPUT_ENABLED:
-                    print(f"[DEBUG] Exception during listener.stop(): {e}")
-                pass
+                _log("[DEBUG] Exception during listener.stop(): %s", e)
             finally:
                 self._listener = None
-                if CONSOLE_OUTPUT_ENABLED:
-                    print("[DEBUG] Listener set to None")
 
     def set_hotkey(self, vk: Optional[int] = None, char: Optional[str] = None, name: Optional[str] = None) -> None:
         """
@@ -135,12 +229,112 @@ class HotkeyHandler:
             self._hotkey_vk = None
         if isinstance(char, str) and len(char) == 1:
             self._hotkey_char = char
+            self._hotkey_char_lower = char.lower()
         else:
             self._hotkey_char = None
+            self._hotkey_char_lower = None
         if isinstance(name, str) and name.startswith("Key."):
             self._hotkey_name = name
         else:
             self._hotkey_name = None
+        self._match = self._build_match()
+
+        # The native backend bakes the vk into its OS registration, so a
+        # running native listener must be re-armed with the new key (or
+        # handed off to pynput if the hotkey is no longer a plain vk).
+        if self._native is not None:
+            try:
+                self._native.stop()
+            except Exception:
+                pass
+            self._native = None
+            self.start()
+
+    def add_toggle_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Subscribe an additional callback to hotkey presses.
+
+        Args:
+            callback: Zero-argument callable invoked on each hotkey fire
+        """
+        if not callable(callback):
+            raise TypeError("callback must be callable")
+        with self._subs_lock:
+            self._subs = self._subs + (callback,)
+
+    def remove_toggle_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Unsubscribe a previously added callback; unknown callbacks are ignored.
+        """
+        with self._subs_lock:
+            self._subs = tuple(cb for cb in self._subs if cb is not callback)
+
+    def _make_listener(self) -> Listener:
+        """Construct the pynput listener (daemonized, not yet started)."""
+        listener = Listener(on_press=self._on_press)
+        # Daemon thread so a wedged hook never blocks process exit
+        listener.daemon = True
+        return listener
+
+    def _native_vk(self) -> Optional[int]:
+        """The vk for the native backend, or None when pynput is required.
+
+        RegisterHotKey only expresses virtual-key hotkeys; char/name configs
+        need pynput's per-key callback to match.
+        """
+        if self._hotkey_vk is not None and self._hotkey_char is None and self._hotkey_name is None:
+            return self._hotkey_vk
+        return None
+
+    def _on_native_hotkey(self) -> None:
+        """WM_HOTKEY callback from the native pump thread.
+
+        MOD_NOREPEAT already suppresses auto-repeat on the OS side; the
+        debounce window is kept for parity with the pynput path.
+        """
+        try:
+            now = time.monotonic()
+            if now - self._last_fire < self._min_interval:
+                return
+            self._last_fire = now
+            _log("[DEBUG] Native hotkey fired. Dispatching to subscribers.")
+            for cb in self._subs:
+                cb()
+        except Exception as e:
+            _log("[DEBUG] Exception in _on_native_hotkey: %s", e)
+
+    def _build_match(self) -> Callable[[object], bool]:
+        """Build a match predicate specialized to the configured fields.
+
+        The branch structure is decided here, once per configuration change,
+        so the per-keystroke call tests only what is actually set. Match
+        order mirrors the general case: vk -> char -> name, duck-typed on
+        the vk attr (KeyCodes carry vk/char, Key enum members carry
+        neither).
+        """
+        vk = self._hotkey_vk
+        char = self._hotkey_char_lower
+        name = self._hotkey_name
+
+        if vk is not None and char is None and name is None:
+            # The default Numpad-5 config: one getattr, one compare.
+            return lambda key, _vk=vk: getattr(key, 'vk', None) == _vk
+
+        if vk is None and char is None and name is None:
+            return lambda key: False
+
+        def match(key: object, _vk=vk, _char=char, _name=name) -> bool:
+            v = getattr(key, 'vk', _NO_VK)
+            if v is not _NO_VK:
+                if _vk is not None and v == _vk:
+                    return True
+                if _char is not None:
+                    c = getattr(key, 'char', None)
+                    return c is not None and c.lower() == _char
+                return False
+            return _name is not None and str(key) == _name
+
+        return match
 
     def _on_press(self, key) -> None:
         """
@@ -153,51 +347,30 @@ class HotkeyHandler:
             key: The key that was pressed (pynput.keyboard.Key or KeyCode)
         """
         try:
-            # DEBUG: Log every key press to understand what we're receiving
+            # DEBUG: per-key dump stays behind the import-time constant so a
+            # non-matching keystroke with logging off pays no call at all.
             if CONSOLE_OUTPUT_ENABLED:
-                print(f"[DEBUG] Key pressed: {key}")
-                print(f"[DEBUG]   Type: {type(key)}")
-                if hasattr(key, 'vk'):
-                    print(f"[DEBUG]   Virtual Key Code: {key.vk}")
-                if hasattr(key, 'char'):
-                    print(f"[DEBUG]   Char: {key.char}")
-            
-            # Match order: vk -> char -> name
-            is_hotkey_match = False
-
-            if isinstance(key, KeyCode):
-                # Prefer virtual key code when present
-                if self._hotkey_vk is not None and hasattr(key, 'vk') and key.vk == self._hotkey_vk:
-                    is_hotkey_match = True
-                elif self._hotkey_char is not None and getattr(key, 'char', None):
-                    try:
-                        if str(key.char).lower() == str(self._hotkey_char).lower():
-                            is_hotkey_match = True
-                    except Exception:
-                        pass
-            else:
-                # pynput Key enum
-                if self._hotkey_name is not None:
-                    if str(key) == self._hotkey_name:
-                        is_hotkey_match = True
-
-            if is_hotkey_match:
-                if CONSOLE_OUTPUT_ENABLED:
-                    print("[DEBUG] Hotkey matched. Calling toggle_callback().")
-                self.toggle_callback()
-            elif CONSOLE_OUTPUT_ENABLED:
-                pass
-                
+                _log("[DEBUG] Key pressed: %s (type %s, vk=%s, char=%s)",
+                     key, type(key), getattr(key, 'vk', None), getattr(key, 'char', None))
+
+            if self._match(key):
+                # Coalesce key-repeat bursts: fires inside the window are
+                # repeats of the same press, not new toggle intents.
+                now = time.monotonic()
+                if now - self._last_fire < self._min_interval:
+                    return
+                self._last_fire = now
+                _log("[DEBUG] Hotkey matched. Dispatching to subscribers.")
+                # Lock-free snapshot read; see _subs in __init__.
+                for cb in self._subs:
+                    cb()
+
         except AttributeError as e:
             # Some special keys may raise AttributeError; prevent listener crash
-            if CONSOLE_OUTPUT_ENABLED:
-                print(f"[DEBUG] AttributeError in _on_press: {e}")
-            pass
+            _log("[DEBUG] AttributeError in _on_press: %s", e)
         except Exception as e:
             # Guard against any unexpected errors from callback or comparison
-            if CONSOLE_OUTPUT_ENABLED:
-                print(f"[DEBUG] Exception in _on_press: {e}")
-            pass
+            _log("[DEBUG] Exception in _on_press: %s", e)
 
     # TODO: Add additional methods for future features:
     # - Multiple hotkey support
@@ -15,10 +15,11 @@ The main application class is responsible for:
 
 import signal
 import sys
+import threading
 from typing import Optional, Tuple
 
 # Import configuration constants
-from .config import CONSOLE_OUTPUT_ENABLED
+from .config import CONSOLE_OUTPUT_ENABLED, LOW_LATENCY_HOTKEY
 
 from .mouse_controller import MouseController
 from .click_scheduler import ClickScheduler
@@ -45,6 +46,21 @@ class ClickClickApp:
     TODO: Manage component lifecycle and cleanup
     """
 
+    # Fixed attribute set: slot descriptors make the ~15 self.* loads per
+    # toggle_clicking call C-level descriptor reads instead of dict lookups.
+    __slots__ = (
+        "is_active",
+        "locked_position",
+        "running",
+        "_shutdown",
+        "mouse_controller",
+        "click_scheduler",
+        "status_indicator",
+        "_has_countdown",
+        "hotkey_handler",
+        "gui",
+    )
+
     def __init__(self) -> None:
         """
         Initialize the ClickClick application.
@@ -52,10 +68,19 @@ class ClickClickApp:
         Sets up all application components and initial state.
         Components are created but not started until run() is called.
         """
+        # Shrink the GIL switch interval so the hotkey listener thread is
+        # scheduled promptly during Tk widget-update bursts; see config.py
+        # for the tradeoff.
+        if LOW_LATENCY_HOTKEY:
+            sys.setswitchinterval(0.001)
+
         # Application state
         self.is_active: bool = False
         self.locked_position: Optional[Tuple[int, int]] = None
         self.running: bool = True
+        # Shutdown barrier: run() blocks on this (zero CPU) when no Tk root
+        # exists to provide a mainloop; cleanup() sets it.
+        self._shutdown = threading.Event()
 
         # Initialize application components
         self.mouse_controller = MouseController()
@@ -63,11 +88,30 @@ class ClickClickApp:
         self.click_scheduler.set_next_delay_callback(self._handle_next_delay)
         # Status indicator overlay with restore callback
         self.status_indicator = StatusIndicator(on_click=self._restore_main_window)
-        self.hotkey_handler = HotkeyHandler(self.toggle_clicking)
+        # Capability check done once here; _handle_next_delay runs per
+        # scheduler tick and reads the cached bool instead of paying a
+        # hasattr (a try/except under the hood) every time.
+        self._has_countdown: bool = hasattr(self.status_indicator, "set_countdown_eta")
+        self.hotkey_handler = HotkeyHandler(self._request_toggle)
         # GUI control window attached to indicator's root if available
         parent_root = self.status_indicator.root if self.status_indicator.root is not None else None
         self.gui = GUIWindow(self, parent_root=parent_root)
 
+    def _request_toggle(self) -> None:
+        """
+        Hotkey callback, invoked on the pynput listener thread.
+
+        Marshals the actual toggle onto the Tk thread through the GUI's
+        event queue: the OS hook callback returns in microseconds instead
+        of running scheduler start/stop and widget updates inline, and the
+        toggle itself touches tkinter from the correct thread.
+        """
+        gui = getattr(self, "gui", None)
+        if gui is not None:
+            gui.post_ui_event(self.toggle_clicking)
+        else:
+            self.toggle_clicking()
+
     def toggle_clicking(self) -> None:
         """
         Toggle the auto-clicker between active and inactive states.
@@ -77,66 +121,59 @@ class ClickClickApp:
         between application states and coordinates all components.
         """
         if not self.is_active:
-            # Transition from inactive to active
-            try:
-                # Lock current mouse position
-                self.mouse_controller.lock_current_position()
-                self.locked_position = self.mouse_controller.locked_position
-
-                # Start clicking
-                self.click_scheduler.start()
-
-                # Update indicator to active state
-                self.status_indicator.show_active()
-                # Update GUI status
-                self.gui.update_status(True, self.locked_position)
-                self.is_active = True
-            except Exception:
-                # Rollback on failure while remaining silent
-                try:
-                    self.click_scheduler.stop()
-                except Exception:
-                    pass
-                try:
-                    self.mouse_controller.unlock_position()
-                except Exception:
-                    pass
-                try:
-                    self.status_indicator.show_inactive()
-                except Exception:
-                    pass
-                try:
-                    self.gui.update_status(False, None)
-                except Exception:
-                    pass
-                self.locked_position = None
-                self.is_active = False
+            self.is_active = self._activate()
         else:
-            # Transition from active to inactive
-            try:
-                # Stop clicking
-                self.click_scheduler.stop()
-            except Exception:
-                pass
+            self._deactivate()
+            self.is_active = False
 
-            # Unlock position
-            try:
-                self.mouse_controller.unlock_position()
-            except Exception:
-                pass
-            self.locked_position = None
+    def _activate(self) -> bool:
+        """
+        Run the activation sequence; returns True on success.
 
-            # Update indicator to inactive state
-            try:
-                self.status_indicator.show_inactive()
-            except Exception:
-                pass
-            try:
-                self.gui.update_status(False, None)
-            except Exception:
-                pass
-            self.is_active = False
-            self._handle_next_delay(None)
+        One exception handler covers the whole sequence instead of a
+        per-step try/except staircase: any failure rolls back through
+        _deactivate, whose steps each tolerate their counterpart not
+        having run.
+        """
+        try:
+            # Lock current mouse position, start clicking, show active state
+            self.mouse_controller.lock_current_position()
+            self.locked_position = self.mouse_controller.locked_position
+            self.click_scheduler.start()
+            self.status_indicator.show_active()
+            self.gui.update_status(True, self.locked_position)
+            return True
+        except Exception:
+            # Rollback on failure while remaining silent
+            self._deactivate()
+            return False
+
+    def _deactivate(self) -> None:
+        """
+        Stop-and-reset sequence shared by deactivation and activation
+        rollback.
+
+        Each step keeps its own guard deliberately: a failed stop must not
+        prevent the unlock or the indicator reset from being attempted.
+        """
+        try:
+            self.click_scheduler.stop()
+        except Exception:
+            pass
+        try:
+            self.mouse_controller.unlock_position()
+        except Exception:
+            pass
+        self.locked_position = None
+        try:
+            self.status_indicator.show_inactive()
+        except Exception:
+            pass
+        try:
+            self.gui.update_status(False, None)
+        except Exception:
+            pass
+        self._handle_next_delay(None)
 
     def run(self) -> None:
         """
@@ -158,11 +195,22 @@ class ClickClickApp:
             signal.signal(signal.SIGINT, self._signal_handler)
 
             # Enter main GUI event loop via shared root
-            if self.status_indicator.root is not None:
-                self.status_indicator.root.mainloop()
+            root = self.status_indicator.root
+            if root is not None:
+                # Consume the shutdown flag on the Tk thread: the signal
+                # handler only sets it (see _signal_handler), and this poll
+                # keeps Ctrl+C responsive even while the C-level mainloop
+                # never re-enters Python on its own.
+                root.after(100, self._poll_shutdown)
+                root.mainloop()
+            else:
+                # Headless fallback: sleep until a signal or cleanup()
+                # flags shutdown instead of spinning the CPU.
+                self._shutdown.wait()
+                self.cleanup()
         except KeyboardInterrupt:
-            # Graceful shutdown on Ctrl+C
-            self._signal_handler(signal.SIGINT, None)
+            # Graceful shutdown on Ctrl+C delivered as an exception
+            self.cleanup()
         except Exception as e:
             # Handle errors silently with optional console logging
             if CONSOLE_OUTPUT_ENABLED:
@@ -172,7 +220,7 @@ class ClickClickApp:
     def _handle_next_delay(self, seconds: Optional[float]) -> None:
         try:
             self.gui.update_next_click_eta(seconds)
-            if hasattr(self, "status_indicator") and hasattr(self.status_indicator, "set_countdown_eta"):
+            if self._has_countdown:
                 self.status_indicator.set_countdown_eta(seconds)
         except Exception:
             pass
@@ -226,25 +274,44 @@ class ClickClickApp:
                 print(f"Cleanup error: {e}")
         finally:
             self.running = False
+            self._shutdown.set()
             if CONSOLE_OUTPUT_ENABLED:
                 print("[DEBUG] cleanup() complete")
 
     def _signal_handler(self, signum, frame) -> None:
         """
         Handle system signals (like Ctrl+C) for graceful shutdown.
-        
+
+        Runs inside Python's signal trampoline, so it does no real work:
+        tearing down Tk or the scheduler from signal context races the
+        mainloop (and is effectively ignored on Windows while the C-level
+        loop is blocked). It only sets the shutdown event; _poll_shutdown
+        or the headless wait in run() consumes it on the right thread.
+
         Args:
             signum: Signal number
             frame: Current stack frame
         """
-        try:
+        self._shutdown.set()
+
+    def _poll_shutdown(self) -> None:
+        """
+        Periodic Tk-thread check for the shutdown flag.
+
+        Scheduled via root.after(100, ...) so teardown runs on the Tk
+        thread with the mainloop cooperating instead of being fought from
+        signal context.
+        """
+        if self._shutdown.is_set():
             self.cleanup()
-        finally:
-            try:
-                sys.exit(0)
-            except SystemExit:
-                # Re-raise to propagate exit cleanly
-                raise
+            return
+        try:
+            root = self.status_indicator.root
+            if root is not None:
+                root.after(100, self._poll_shutdown)
+        except Exception:
+            # Root destroyed mid-shutdown; nothing left to poll.
+            pass
 
     def get_status(self) -> dict:
         """
@@ -8,11 +8,24 @@ This module handles all mouse-related operations including:
 """
 
 import random
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 # Import configuration constants
 from .config import POSITION_OFFSET_RANGE, CONSOLE_OUTPUT_ENABLED
 
+# Native Windows click backend (SendInput); unavailable on other platforms
+from . import win32_mouse
+
+# Debug logging bound once at import: a real printer when console output is
+# enabled, a no-op otherwise. Callers pass printf-style args so no message
+# string is built when logging is disabled.
+if CONSOLE_OUTPUT_ENABLED:
+    def _log(message: str, *args: object) -> None:
+        print(message % args if args else message)
+else:
+    def _log(message: str, *args: object) -> None:
+        pass
+
 # Import pyautogui for mouse control with graceful fallback when unavailable
 try:
     import pyautogui  # type: ignore
@@ -31,8 +44,40 @@ except Exception as import_error:  # pragma: no cover - exercised in headless CI
             return None
 
     pyautogui = _PyAutoGUIStub()  # type: ignore[assignment]
-    if CONSOLE_OUTPUT_ENABLED:
-        print(f"[DEBUG] Using PyAutoGUI stub due to import error: {import_error}")
+    _log("[DEBUG] Using PyAutoGUI stub due to import error: %s", import_error)
+
+
+# One-shot guard for process-global pyautogui settings; re-running it per
+# MouseController construction (tests build many) buys nothing.
+_pyautogui_configured = False
+
+
+def _configure_pyautogui() -> None:
+    """Apply process-global pyautogui settings once, on first construction."""
+    global _pyautogui_configured
+    if _pyautogui_configured:
+        return
+    _pyautogui_configured = True
+    try:
+        # Fail-safe allows moving the mouse to a corner to abort operations
+        pyautogui.FAILSAFE = True
+        # Drop the default 0.1 s sleep pyautogui adds after every action;
+        # the scheduler owns all inter-click timing.
+        pyautogui.PAUSE = 0
+    except Exception:
+        # Keep silent to avoid crashing in environments where pyautogui
+        # configuration may not be available.
+        _log("PyAutoGUI configuration could not be applied")
+
+
+def _coerce_point(pos) -> Tuple[int, int]:
+    """Coerce a Point-like position (x/y attributes) to an int tuple."""
+    return (int(pos.x), int(pos.y))
+
+
+def _coerce_tuple(pos) -> Tuple[int, int]:
+    """Coerce an indexable position to an int tuple."""
+    return (int(pos[0]), int(pos[1]))
 
 
 class MouseController:
@@ -55,16 +100,28 @@ class MouseController:
         self.locked_position: Optional[Tuple[int, int]] = None
         # Runtime-adjustable offset range (defaults to config)
         self.offset_range: int = POSITION_OFFSET_RANGE
-        
-        # PyAutoGUI configuration (fail-safe settings)
-        # Fail-safe allows moving the mouse to a corner to abort operations
-        try:
-            pyautogui.FAILSAFE = True
-        except Exception:
-            # Keep silent to avoid crashing in environments where pyautogui
-            # configuration may not be available.
-            if CONSOLE_OUTPUT_ENABLED:
-                print("PyAutoGUI fail-safe configuration could not be set")
+        # Sampler closure specialized to the current range; rebuilt by
+        # set_offset_range so the per-click path never re-reads or
+        # re-validates the bounds.
+        self._offset_sampler: Callable[[], Tuple[int, int]] = self._build_offset_sampler()
+        # Position-coercion function, resolved on the first lock: the
+        # return type of pyautogui.position() never changes for a given
+        # backend, so the hasattr dispatch runs at most once.
+        self._coerce_pos: Optional[Callable[[object], Tuple[int, int]]] = None
+
+        # Click dispatcher chosen once at construction: the native Windows
+        # SendInput path where available (two C calls per click), else the
+        # pyautogui fallback.
+        native = win32_mouse.make_clicker()
+        if native is not None:
+            self._click_xy: Callable[[int, int], None] = native
+        else:
+            self._click_xy = self._pyautogui_click
+
+
+        # PyAutoGUI process-global configuration (fail-safe, no pause);
+        # applied once for the whole process, see _configure_pyautogui.
+        _configure_pyautogui()
 
     def lock_current_position(self) -> None:
         """
@@ -75,20 +132,17 @@ class MouseController:
         """
         try:
             pos = pyautogui.position()
-            # Support both Point-like objects and tuples
-            if hasattr(pos, "x") and hasattr(pos, "y"):
-                x = int(pos.x)
-                y = int(pos.y)
-            else:
-                x = int(pos[0])
-                y = int(pos[1])
-            self.locked_position = (x, y)
-            if CONSOLE_OUTPUT_ENABLED:
-                print(f"Locked mouse position at ({x}, {y})")
+            # Support both Point-like objects and tuples; the type check
+            # runs once and the chosen coercion is cached for later locks.
+            coerce = self._coerce_pos
+            if coerce is None:
+                coerce = _coerce_point if hasattr(pos, "x") and hasattr(pos, "y") else _coerce_tuple
+                self._coerce_pos = coerce
+            self.locked_position = coerce(pos)
+            _log("Locked mouse position at %s", self.locked_position)
         except Exception as e:
             # Silent failure per requirements
-            if CONSOLE_OUTPUT_ENABLED:
-                print(f"Failed to lock mouse position: {e}")
+            _log("Failed to lock mouse position: %s", e)
     def unlock_position(self) -> None:
         """
         Clear the locked mouse position.
@@ -98,11 +152,10 @@ class MouseController:
         """
         prev = self.locked_position
         self.locked_position = None
-        if CONSOLE_OUTPUT_ENABLED:
-            if prev is not None:
-                print(f"Unlocked mouse position from {prev}")
-            else:
-                print("Unlock requested but no position was locked")
+        if prev is not None:
+            _log("Unlocked mouse position from %s", prev)
+        else:
+            _log("Unlock requested but no position was locked")
 
     def click_at_locked_position(self) -> None:
         """
@@ -123,17 +176,21 @@ class MouseController:
             target_x = int(self.locked_position[0] + offset_x)
             target_y = int(self.locked_position[1] + offset_y)
             
-            if CONSOLE_OUTPUT_ENABLED:
-                print(f"Clicking at ({target_x}, {target_y}) with offset ({offset_x}, {offset_y})")
-            
-            # Execute the click
-            pyautogui.click(x=target_x, y=target_y)
+            _log("Clicking at (%s, %s) with offset (%s, %s)",
+                 target_x, target_y, offset_x, offset_y)
+
+            # Execute the click via the dispatcher chosen at construction
+            self._click_xy(target_x, target_y)
         except Exception as e:
             # Silent failure per requirements
-            if CONSOLE_OUTPUT_ENABLED:
-                print(f"Click execution error: {e}")
+            _log("Click execution error: %s", e)
 
 
+    def _pyautogui_click(self, x: int, y: int) -> None:
+        """Fallback click path; looks pyautogui.click up at call time so
+        test patches of the module attribute keep working."""
+        pyautogui.click(x=x, y=y)
+
     def set_offset_range(self, value: int) -> None:
         """
         Update the position offset range used for randomization.
@@ -145,18 +202,34 @@ class MouseController:
         except (TypeError, ValueError):
             return
         self.offset_range = max(0, min(50, v))
+        self._offset_sampler = self._build_offset_sampler()
+
+    def _build_offset_sampler(self) -> Callable[[], Tuple[int, int]]:
+        """
+        Build a sampler closure specialized to the current offset range.
+
+        randint re-validates its bounds and walks the _randbelow machinery
+        on every call; the closure instead captures the bounds once and
+        derives each offset from a bare random.random() C call, the same
+        specialization the click scheduler applies to its delays. A zero
+        range skips the RNG entirely.
+        """
+        rng = self.offset_range
+        if rng == 0:
+            return lambda: (0, 0)
+        lo = -rng
+        span = 2 * rng + 1
+        rnd = random.random
+        return lambda: (lo + int(rnd() * span), lo + int(rnd() * span))
 
     def _get_random_offset(self) -> Tuple[int, int]:
         """
         Calculate random offset within the configured position range.
-        
+
         Returns a tuple (offset_x, offset_y) where each value is randomly
         chosen within the range [-POSITION_OFFSET_RANGE, POSITION_OFFSET_RANGE].
-        
+
         Returns:
             Tuple[int, int]: Random offset coordinates
         """
-        rng = int(self.offset_range)
-        offset_x = random.randint(-rng, rng)
-        offset_y = random.randint(-rng, rng)
-        return (offset_x, offset_y)
+        return self._offset_sampler()
@@ -7,6 +7,8 @@ appears as a small overlay in a screen corner and changes color
 based on whether the auto-clicker is active or inactive.
 """
 
+import sys
+import threading
 import time
 import tkinter as tk
 from typing import Optional, Tuple, Callable
@@ -19,6 +21,27 @@ from .config import (
 
 # TODO: Import configuration constants in Phase 4 implementation
 
+# Module-level alias: the countdown tick reads the clock every pass, and a
+# LOAD_GLOBAL of the bound function beats the time-module attribute hop.
+# The _ns variant returns an int, so the deadline check is integer
+# arithmetic with no float allocation.
+_monotonic_ns = time.monotonic_ns
+
+# Platform check resolved once at import: sys.platform is a constant
+# string, unlike platform.system() which may shell out to uname() on
+# first call.
+_IS_WINDOWS = sys.platform.startswith("win")
+
+# Corner name -> (align right?, align bottom?) flags; replaces the
+# substring-scan ladder in _calculate_position. Unknown names fall back
+# to the top-right default the ladder produced.
+_POSITION_TABLE = {
+    "top-left": (False, False),
+    "top-right": (True, False),
+    "bottom-left": (False, True),
+    "bottom-right": (True, True),
+}
+
 
 class StatusIndicator:
     """
@@ -51,10 +74,27 @@ class StatusIndicator:
         self.circle_id: Optional[int] = None
         self.arc_id: Optional[int] = None
         self._on_click_cb = on_click
-        self._countdown_target_ts: Optional[float] = None
-        self._countdown_total_interval: Optional[float] = None
+        # Screen dimensions cached on first use; each winfo_screen* call
+        # is a Tk round trip and the values do not change mid-session.
+        self._screen_size: Optional[Tuple[int, int]] = None
+        self._countdown_target_ns: Optional[int] = None
+        self._countdown_total_ns: Optional[int] = None
         self._countdown_after: Optional[str] = None
         self._is_active: bool = False
+        # Set by destroy(); repeated destroy calls (signal handler plus
+        # normal cleanup) return immediately after the first.
+        self._destroyed: bool = False
+        # Extent last pushed to the arc, None while the arc is hidden.
+        # On a 30 px circle ~12 degrees equal one pixel of arc, so redraws
+        # are skipped until the extent moves at least half a pixel.
+        self._last_extent: Optional[float] = None
+        # Fill currently applied to the circle; show_active/show_inactive
+        # compare against it so a repeated state call skips the canvas
+        # redraw entirely. The canvas is created with the inactive fill.
+        self._current_fill: str = INDICATOR_COLOR_INACTIVE
+        # Thread that created the Tk root; same-thread callers can touch
+        # widgets directly instead of paying an after(0) queue round trip.
+        self._gui_thread_id: int = threading.get_ident()
 
         # Configure window and create the indicator
         self._setup_window()
@@ -64,21 +104,41 @@ class StatusIndicator:
     def show_active(self) -> None:
         """
         Change the indicator to active state (green color).
-        Uses tkinter's after to be thread-safe if invoked from non-GUI threads.
+        Applies directly when called on the GUI thread; otherwise marshals
+        via tkinter's after for thread safety.
         """
         self._is_active = True
+        if self._current_fill == INDICATOR_COLOR_ACTIVE:
+            return
+        self._current_fill = INDICATOR_COLOR_ACTIVE
         if self.root is not None and self.canvas is not None and self.circle_id is not None:
-            self.root.after(0, lambda: self.canvas.itemconfig(self.circle_id, fill=INDICATOR_COLOR_ACTIVE))
+            if threading.get_ident() == self._gui_thread_id:
+                self._apply_active_fill()
+            else:
+                self.root.after(0, self._apply_active_fill)
 
     def show_inactive(self) -> None:
         """
         Change the indicator to inactive state (red color).
-        Uses tkinter's after to be thread-safe if invoked from non-GUI threads.
+        Applies directly when called on the GUI thread; otherwise marshals
+        via tkinter's after for thread safety.
         """
         self._is_active = False
         self.set_countdown_eta(None)
+        if self._current_fill == INDICATOR_COLOR_INACTIVE:
+            return
+        self._current_fill = INDICATOR_COLOR_INACTIVE
         if self.root is not None and self.canvas is not None and self.circle_id is not None:
-            self.root.after(0, lambda: self.canvas.itemconfig(self.circle_id, fill=INDICATOR_COLOR_INACTIVE))
+            if threading.get_ident() == self._gui_thread_id:
+                self._apply_inactive_fill()
+            else:
+                self.root.after(0, self._apply_inactive_fill)
+
+    def _apply_active_fill(self) -> None:
+        self.canvas.itemconfig(self.circle_id, fill=INDICATOR_COLOR_ACTIVE)
+
+    def _apply_inactive_fill(self) -> None:
+        self.canvas.itemconfig(self.circle_id, fill=INDICATOR_COLOR_INACTIVE)
 
     def set_countdown_eta(self, seconds: Optional[float]) -> None:
         """
@@ -86,38 +146,49 @@ class StatusIndicator:
         """
         if self.root is None:
             return
-
-        def _apply() -> None:
+        if threading.get_ident() == self._gui_thread_id:
             self._apply_countdown_eta(seconds)
-
+            return
         try:
-            self.root.after(0, _apply)
+            # after() forwards extra args, so no closure needs allocating
+            self.root.after(0, self._apply_countdown_eta, seconds)
         except Exception:
-            _apply()
+            self._apply_countdown_eta(seconds)
 
     def destroy(self) -> None:
         """
         Close the indicator window and cleanup resources.
+
+        Idempotent: only the first call does any Tk work.
         """
-        if self.root is not None:
+        if self._destroyed:
+            return
+        self._destroyed = True
+        root = self.root
+        if root is None:
+            return
+
+        # Cancel the countdown tick while the root is still alive;
+        # after_cancel against a destroyed root can only raise.
+        if self._countdown_after is not None:
             try:
-                # Safely destroy the tkinter window
-                self.root.destroy()
-            except tk.TclError:
-                # Window may already be destroyed; ignore
+                root.after_cancel(self._countdown_after)
+            except Exception:
                 pass
-            finally:
-                # Reset references
-                if self._countdown_after is not None:
-                    try:
-                        self.root.after_cancel(self._countdown_after)
-                    except Exception:
-                        pass
-                self._countdown_after = None
-                self.root = None
-                self.canvas = None
-                self.circle_id = None
-                self.arc_id = None
+            self._countdown_after = None
+
+        try:
+            # Safely destroy the tkinter window
+            root.destroy()
+        except tk.TclError:
+            # Window may already be destroyed; ignore
+            pass
+        finally:
+            # Reset references
+            self.root = None
+            self.canvas = None
+            self.circle_id = None
+            self.arc_id = None
 
     def _bind_click(self) -> None:
         """
@@ -150,31 +221,20 @@ class StatusIndicator:
         if self.root is None:
             return 0, 0
 
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
+        if self._screen_size is None:
+            self._screen_size = (
+                self.root.winfo_screenwidth(),
+                self.root.winfo_screenheight(),
+            )
+        screen_width, screen_height = self._screen_size
 
         size = INDICATOR_SIZE
         margin = INDICATOR_MARGIN
         position = (INDICATOR_POSITION or 'top-right').lower()
 
-        # Vertical position
-        if 'top' in position:
-            y = margin
-        elif 'bottom' in position:
-            y = max(0, screen_height - size - margin)
-        else:
-            # Default to top if unspecified
-            y = margin
-
-        # Horizontal position
-        if 'left' in position:
-            x = margin
-        elif 'right' in position:
-            x = max(0, screen_width - size - margin)
-        else:
-            # Default to right if unspecified
-            x = max(0, screen_width - size - margin)
-
+        right, bottom = _POSITION_TABLE.get(position, (True, False))
+        x = max(0, screen_width - size - margin) if right else margin
+        y = max(0, screen_height - size - margin) if bottom else margin
         return x, y
 
     def _setup_window(self) -> None:
@@ -209,14 +269,13 @@ class StatusIndicator:
             pass
 
         # Platform-specific transparency handling
-        try:
-            import platform
-            if platform.system() == 'Windows':
+        if _IS_WINDOWS:
+            try:
                 # Make white color fully transparent on Windows
                 self.root.attributes('-transparentcolor', 'white')
-        except Exception:
-            # Be conservative: any platform-specific issues are non-fatal
-            pass
+            except Exception:
+                # Be conservative: any platform-specific issues are non-fatal
+                pass
 
         # Disable resizing
         self.root.resizable(False, False)
@@ -273,49 +332,67 @@ class StatusIndicator:
 
     def _apply_countdown_eta(self, seconds: Optional[float]) -> None:
         if seconds is None or seconds <= 0 or not self._is_active:
-            self._countdown_target_ts = None
-            self._countdown_total_interval = None
+            self._countdown_target_ns = None
+            self._countdown_total_ns = None
             self._update_countdown_arc()
             return
-        self._countdown_target_ts = time.monotonic() + float(seconds)
-        self._countdown_total_interval = float(seconds)
+        total_ns = int(seconds * 1_000_000_000)
+        self._countdown_target_ns = _monotonic_ns() + total_ns
+        self._countdown_total_ns = total_ns
         self._update_countdown_arc()
         self._ensure_countdown_loop()
 
     def _ensure_countdown_loop(self) -> None:
         if self.root is None or self._countdown_after is not None:
             return
-
-        def _tick() -> None:
-            self._countdown_after = None
-            self._update_countdown_arc()
-            if self._countdown_target_ts is not None:
-                self._ensure_countdown_loop()
-
-        self._countdown_after = self.root.after(120, _tick)
+        # 5 Hz is plenty for an arc that moves at most a few pixels per
+        # second; halving the old 120 ms rate halves event-loop wakeups.
+        self._countdown_after = self.root.after(200, self._countdown_tick)
+
+    def _countdown_tick(self) -> None:
+        """Recurring countdown tick; reschedules itself while a target
+        remains, so no fresh closure is allocated per tick."""
+        self._countdown_after = None
+        self._update_countdown_arc()
+        if self._countdown_target_ns is not None and self.root is not None:
+            self._countdown_after = self.root.after(200, self._countdown_tick)
 
     def _update_countdown_arc(self) -> None:
-        if self.canvas is None or self.arc_id is None:
+        # Runs every 200 ms while a countdown is live; hoist the attribute
+        # reads into locals once instead of re-reading them per expression.
+        canvas = self.canvas
+        arc_id = self.arc_id
+        if canvas is None or arc_id is None:
             return
-        if (
-            not self._is_active
-            or self._countdown_target_ts is None
-            or self._countdown_total_interval is None
-            or self._countdown_total_interval <= 0
-        ):
-            self.canvas.itemconfigure(self.arc_id, state="hidden", extent=0)
+        target = self._countdown_target_ns
+        total = self._countdown_total_ns
+        if not self._is_active or target is None or total is None or total <= 0:
+            self._hide_countdown_arc()
             return
 
-        remaining = max(0.0, self._countdown_target_ts - time.monotonic())
+        # Pure integer arithmetic until the single fraction division below
+        remaining = target - _monotonic_ns()
         if remaining <= 0:
-            self.canvas.itemconfigure(self.arc_id, state="hidden", extent=0)
-            self._countdown_target_ts = None
-            self._countdown_total_interval = None
+            self._hide_countdown_arc()
+            self._countdown_target_ns = None
+            self._countdown_total_ns = None
             return
 
-        fraction = max(0.0, min(1.0, remaining / self._countdown_total_interval))
+        fraction = min(1.0, remaining / total)
         extent = -360 * fraction  # clockwise
-        self.canvas.itemconfigure(self.arc_id, state="normal", extent=extent)
+        # Skip the redraw while the change is sub-pixel; see _last_extent.
+        last = self._last_extent
+        if last is not None and abs(extent - last) < 6.0:
+            return
+        self._last_extent = extent
+        canvas.itemconfigure(arc_id, state="normal", extent=extent)
+
+    def _hide_countdown_arc(self) -> None:
+        """Hide the arc; a no-op when it is already hidden."""
+        if self._last_extent is None:
+            return
+        self._last_extent = None
+        self.canvas.itemconfigure(self.arc_id, state="hidden", extent=0)
         
     # TODO: Add additional methods for future features:
     # - Multiple indicator support (multi-monitor)
@@ -0,0 +1,137 @@
+"""
+Windows-native hotkey backend for ClickClick auto-clicker application.
+
+pynput's listener installs a low-level keyboard hook that marshals every
+keystroke on the system into Python. RegisterHotKey lets the kernel do the
+filtering instead: only WM_HOTKEY messages for the registered key reach the
+message pump, so no Python code runs for unrelated keystrokes and the
+process is never exposed to the low-level-hook timeout.
+
+The module imports on any platform; ``is_supported()`` gates actual use and
+``HotkeyHandler`` falls back to pynput when it returns False or
+registration fails (e.g. the key is already claimed by another app).
+"""
+
+import ctypes
+import os
+import threading
+from typing import Callable, Optional
+
+# Win32 constants (winuser.h)
+WM_HOTKEY = 0x0312
+WM_QUIT = 0x0012
+MOD_NOREPEAT = 0x4000  # suppress auto-repeat WM_HOTKEY storms (Win7+)
+
+_HOTKEY_ID = 1
+
+
+class _MSG(ctypes.Structure):
+    """Minimal MSG layout; defined locally so importing this module does not
+    require ctypes.wintypes on non-Windows platforms."""
+
+    _fields_ = (
+        ("hwnd", ctypes.c_void_p),
+        ("message", ctypes.c_uint),
+        ("wParam", ctypes.c_size_t),
+        ("lParam", ctypes.c_ssize_t),
+        ("time", ctypes.c_uint32),
+        ("pt_x", ctypes.c_long),
+        ("pt_y", ctypes.c_long),
+    )
+
+
+def is_supported() -> bool:
+    """Whether the native backend can run on this platform."""
+    return os.name == "nt"
+
+
+class Win32HotkeyListener:
+    """
+    Kernel-filtered hotkey listener built on RegisterHotKey.
+
+    A dedicated daemon thread owns the registration (RegisterHotKey binds
+    the hotkey to the calling thread's message queue) and pumps messages
+    with GetMessageW, invoking the callback once per WM_HOTKEY. stop()
+    posts WM_QUIT to the pump thread.
+    """
+
+    def __init__(self, vk: int, callback: Callable[[], None]) -> None:
+        self._vk = int(vk)
+        self._callback = callback
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id: Optional[int] = None
+        self._registered = False
+        self._started = threading.Event()
+
+    def start(self) -> bool:
+        """Start the pump thread; returns True once the hotkey registered.
+
+        Returns False if registration failed (key claimed elsewhere, or the
+        platform call errored), in which case no thread keeps running.
+        """
+        if not is_supported():
+            return False
+        if self._thread is not None and self._thread.is_alive():
+            return self._registered
+        self._started.clear()
+        self._registered = False
+        self._thread = threading.Thread(
+            target=self._run, name="Win32Hotkey", daemon=True
+        )
+        self._thread.start()
+        # Registration happens first thing on the pump thread; wait briefly
+        # for its verdict so callers can fall back synchronously.
+        self._started.wait(1.0)
+        return self._registered
+
+    def _run(self) -> None:
+        try:
+            user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+            kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        except AttributeError:
+            self._started.set()
+            return
+        self._thread_id = kernel32.GetCurrentThreadId()
+        try:
+            self._registered = bool(
+                user32.RegisterHotKey(None, _HOTKEY_ID, MOD_NOREPEAT, self._vk)
+            )
+        except Exception:
+            self._registered = False
+        finally:
+            self._started.set()
+        if not self._registered:
+            return
+
+        msg = _MSG()
+        try:
+            # GetMessageW blocks in the kernel consuming zero CPU; only the
+            # registered hotkey (and the WM_QUIT from stop()) wake it.
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_HOTKEY:
+                    try:
+                        self._callback()
+                    except Exception:
+                        pass
+        finally:
+            try:
+                user32.UnregisterHotKey(None, _HOTKEY_ID)
+            except Exception:
+                pass
+            self._registered = False
+
+    def stop(self) -> None:
+        """Unhook by asking the pump thread to exit; bounded, non-blocking
+        beyond a short join."""
+        thread = self._thread
+        thread_id = self._thread_id
+        self._thread = None
+        if thread is None or not thread.is_alive() or thread_id is None:
+            return
+        try:
+            ctypes.windll.user32.PostThreadMessageW(  # type: ignore[attr-defined]
+                thread_id, WM_QUIT, 0, 0
+            )
+        except Exception:
+            return
+        thread.join(timeout=0.05)
@@ -0,0 +1,82 @@
+"""
+Windows-native click backend for ClickClick auto-clicker application.
+
+pyautogui.click is convenient but heavy: it tweens the cursor, sleeps for
+pyautogui.PAUSE (0.1 s by default) and makes several user32 round trips
+per click. The native path is the whole operation in two calls —
+SetCursorPos plus one SendInput carrying prebuilt button-down/button-up
+events — which turns a ~100 ms click into a sub-millisecond one.
+
+The module imports on any platform; ``make_clicker()`` returns None where
+the backend is unavailable and MouseController falls back to pyautogui.
+"""
+
+import ctypes
+import os
+from typing import Callable, Optional
+
+# Win32 constants (winuser.h)
+INPUT_MOUSE = 0
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = (
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_void_p),
+    )
+
+
+class _INPUT(ctypes.Structure):
+    """INPUT with only the mouse arm of the union; MOUSEINPUT is the
+    largest union member, so the size (which SendInput validates) matches
+    the full definition."""
+
+    _fields_ = (
+        ("type", ctypes.c_uint32),
+        ("mi", _MOUSEINPUT),
+    )
+
+
+def is_supported() -> bool:
+    """Whether the native backend can run on this platform."""
+    return os.name == "nt"
+
+
+def make_clicker() -> Optional[Callable[[int, int], None]]:
+    """
+    Build a click(x, y) callable bound to prebuilt INPUT structures.
+
+    The down/up event pair, the struct size and the user32 entry points
+    are all captured once here; each click is then two C calls with no
+    per-click allocation. Returns None when the backend is unavailable
+    (non-Windows, or user32 could not be loaded).
+    """
+    if not is_supported():
+        return None
+    try:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+    except Exception:
+        return None
+
+    events = (_INPUT * 2)()
+    events[0].type = INPUT_MOUSE
+    events[0].mi.dwFlags = MOUSEEVENTF_LEFTDOWN
+    events[1].type = INPUT_MOUSE
+    events[1].mi.dwFlags = MOUSEEVENTF_LEFTUP
+
+    set_cursor = user32.SetCursorPos
+    send_input = user32.SendInput
+    events_ref = ctypes.byref(events)
+    input_size = ctypes.sizeof(_INPUT)
+
+    def click(x: int, y: int) -> None:
+        set_cursor(x, y)
+        send_input(2, events_ref, input_size)
+
+    return click
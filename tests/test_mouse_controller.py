@@ -8,76 +8,113 @@ Validates:
 - Silent error handling during click
 """
 
+import copy
 import unittest
-from unittest.mock import patch
+from collections import namedtuple
+from unittest.mock import call, patch
 
 from src.mouse_controller import MouseController
 from src.config import POSITION_OFFSET_RANGE
 
+# Dotted patch targets shared by the tests below
+_POSITION_TARGET = "src.mouse_controller.pyautogui.position"
+_CLICK_TARGET = "src.mouse_controller.pyautogui.click"
 
-class TestMouseController(unittest.TestCase):
-    """Tests for MouseController behavior."""
-
-    def test_lock_current_position_captures_correct_coordinates_with_xy_attrs(self) -> None:
-        """lock_current_position stores current mouse coordinates when position has x/y attrs."""
-        controller = MouseController()
-        fake_point = type("Point", (), {"x": 150, "y": 275})()
-
-        with patch("src.mouse_controller.pyautogui.position", return_value=fake_point):
-            controller.lock_current_position()
+# Reusable failure for the silent-error test; Mock re-raises the same
+# instance each time, so no per-run exception construction is needed.
+_BOOM = RuntimeError("boom")
 
-        self.assertEqual(controller.locked_position, (150, 275))
+# Point-like position stand-in (pyautogui returns a namedtuple too); the
+# class is created once at import instead of via type() inside the test.
+_Point = namedtuple("_Point", "x y")
 
-    def test_lock_current_position_captures_correct_coordinates_with_tuple(self) -> None:
-        """lock_current_position stores current mouse coordinates when position is a tuple."""
-        controller = MouseController()
-        fake_point = (321, 654)
 
-        with patch("src.mouse_controller.pyautogui.position", return_value=fake_point):
-            controller.lock_current_position()
+class TestMouseController(unittest.TestCase):
+    """Tests for MouseController behavior."""
 
-        self.assertEqual(controller.locked_position, (321, 654))
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Construct once for the class; __init__ does backend dispatch and
+        # process-global pyautogui configuration that need not repeat.
+        cls._controller_template = MouseController()
+
+    def setUp(self) -> None:
+        # Shallow copy is enough: controller state is flat attributes plus
+        # stateless closures. Each test gets its own instance to mutate.
+        self.controller = copy.copy(self._controller_template)
+        self.controller.locked_position = None
+
+    def test_lock_current_position_captures_correct_coordinates(self) -> None:
+        """lock_current_position stores coordinates for both position shapes."""
+        cases = [
+            ("xy attrs", _Point(150, 275), (150, 275)),
+            ("tuple", (321, 654), (321, 654)),
+        ]
+        for label, fake_point, expected in cases:
+            with self.subTest(label):
+                # Fresh copy per case: the controller caches its position
+                # coercion after the first lock, and each shape must
+                # exercise the cold dispatch.
+                controller = copy.copy(self._controller_template)
+                controller.locked_position = None
+                with patch(_POSITION_TARGET, return_value=fake_point):
+                    controller.lock_current_position()
+                self.assertEqual(controller.locked_position, expected)
 
     def test_random_offsets_within_range(self) -> None:
         """_get_random_offset returns values within +/- POSITION_OFFSET_RANGE."""
-        controller = MouseController()
+        controller = self.controller
 
-        for _ in range(200):
-            ox, oy = controller._get_random_offset()
-            self.assertGreaterEqual(ox, -POSITION_OFFSET_RANGE)
-            self.assertLessEqual(ox, POSITION_OFFSET_RANGE)
-            self.assertGreaterEqual(oy, -POSITION_OFFSET_RANGE)
-            self.assertLessEqual(oy, POSITION_OFFSET_RANGE)
+        # Collect all 200 samples first and bound-check the extremes once;
+        # same coverage as asserting each sample, minus 800 assert calls.
+        sample = controller._get_random_offset
+        samples = [value for _ in range(200) for value in sample()]
+        self.assertGreaterEqual(min(samples), -POSITION_OFFSET_RANGE)
+        self.assertLessEqual(max(samples), POSITION_OFFSET_RANGE)
 
     def test_click_executes_at_correct_position(self) -> None:
         """click_at_locked_position calls pyautogui.click with locked position plus offset."""
-        controller = MouseController()
-        controller.locked_position = (100, 200)
-
-        with patch.object(MouseController, "_get_random_offset", return_value=(2, -3)):
-            with patch("src.mouse_controller.pyautogui.click") as mock_click:
-                controller.click_at_locked_position()
-                mock_click.assert_called_once_with(x=102, y=197)
+        controller = self.controller
+        # (locked position, forced offset, expected click target); the
+        # whole grid runs under one patch pair and is verified in a single
+        # call_args_list comparison.
+        cases = [
+            ((100, 200), (2, -3), (102, 197)),
+            ((0, 0), (5, 5), (5, 5)),
+            ((50, 60), (-3, 0), (47, 60)),
+        ]
+
+        offsets = [offset for _, offset, _ in cases]
+        with patch.object(MouseController, "_get_random_offset", side_effect=offsets):
+            with patch(_CLICK_TARGET) as mock_click:
+                for locked, _, _ in cases:
+                    controller.locked_position = locked
+                    controller.click_at_locked_position()
+
+        self.assertEqual(
+            mock_click.call_args_list,
+            [call(x=ex, y=ey) for _, _, (ex, ey) in cases],
+        )
 
     def test_click_does_nothing_when_position_not_locked(self) -> None:
         """click_at_locked_position returns early when no position is locked."""
-        controller = MouseController()
+        controller = self.controller
         controller.locked_position = None
 
-        with patch("src.mouse_controller.pyautogui.click") as mock_click:
+        with patch(_CLICK_TARGET) as mock_click:
             controller.click_at_locked_position()
             mock_click.assert_not_called()
 
     def test_click_silent_error_handling(self) -> None:
         """Errors during click are caught and do not propagate."""
-        controller = MouseController()
+        controller = self.controller
         controller.locked_position = (50, 60)
 
-        with patch("src.mouse_controller.pyautogui.click", side_effect=RuntimeError("boom")):
-            # Ensure logging is disabled to keep output silent
-            with patch("src.mouse_controller.CONSOLE_OUTPUT_ENABLED", False):
-                # Should not raise
-                controller.click_at_locked_position()
+        # Debug output is bound at import (off by default), so no
+        # CONSOLE_OUTPUT_ENABLED patch is needed to keep the test silent.
+        with patch(_CLICK_TARGET, side_effect=_BOOM):
+            # Should not raise
+            controller.click_at_locked_position()
 
 
 if __name__ == "__main__":